@@ -1,5 +1,7 @@
+from contextlib import contextmanager
 import logging
-from copy import copy
+from typing import Union
+from weakref import WeakKeyDictionary
 
 from opentrons.util import calibration_functions
 from opentrons.config import feature_flags as ff
@@ -12,7 +14,9 @@ from .models import Container
 
 log = logging.getLogger(__name__)
 
-VALID_STATES = {'probing', 'moving', 'ready'}
+VALID_STATES = frozenset(('probing', 'moving', 'ready'))
+# States in which the hardware should use the safest travel height
+_SAFE_STATES = frozenset(('probing', 'moving'))
 
 
 class CalibrationManager:
@@ -27,6 +31,12 @@ class CalibrationManager:
         self._hardware = hardware
         self._loop = loop
         self.state = None
+        # The protocol api version can only change across a restart, so pick
+        # the implementation of the calibration actions once
+        if ff.use_protocol_api_v2():
+            self._ops: '_Ops' = _V2Ops(hardware)
+        else:
+            self._ops = _V1Ops()
 
     def _set_state(self, state):
         if state not in VALID_STATES:
@@ -35,37 +45,29 @@ class CalibrationManager:
         self.state = state
         self._on_state_changed()
 
-    def tip_probe(self, instrument):
-        inst = instrument._instrument
-        log.info('Probing tip with {}'.format(instrument.name))
-        self._set_state('probing')
+    def begin_session(self, instrument):
+        """ Keep the instrument's protocol context connected to the hardware
+        until :py:meth:`end_session`.
 
-        if ff.use_protocol_api_v2():
-            mount = Mount[instrument._instrument.mount.upper()]
-            assert instrument.tip_racks,\
-                'No known tipracks for {}'.format(instrument)
-            tip_length = instrument.tip_racks[0]._container.tip_length
-            measured_center = self._hardware.locate_tip_probe_center(
-                mount, tip_length)
-        else:
-            measured_center = calibration_functions.probe_instrument(
-                instrument=inst,
-                robot=inst.robot)
-
-        log.info('Measured probe top center: {0}'.format(measured_center))
-
-        if ff.use_protocol_api_v2():
-            self._hardware.update_instrument_offset(
-                Mount[instrument._instrument.mount.upper()],
-                from_tip_probe=measured_center)
-            config = self._hardware.config
-        else:
-            config = calibration_functions.update_instrument_config(
-                instrument=inst,
-                measured_center=measured_center)
+        Otherwise, each calibration action connects the context to the
+        hardware and disconnects it again afterwards. This does nothing when
+        not using protocol api v2.
+        """
+        self._ops.begin_session(instrument)
 
-        log.info('New config: {0}'.format(config))
+    def end_session(self):
+        """ Release the connection made by :py:meth:`begin_session`, if any
+        """
+        self._ops.end_session()
 
+    def tip_probe(self, instrument):
+        log.info('Probing tip with %s', instrument.name)
+        self._set_state('probing')
+        measured_center = self._ops.locate_tip_probe_center(instrument)
+        log.info('Measured probe top center: %s', measured_center)
+        config = self._ops.update_instrument_config(
+            instrument, measured_center)
+        log.info('New config: %s', config)
         self.move_to_front(instrument)
         self._set_state('ready')
 
@@ -75,16 +77,10 @@ class CalibrationManager:
                 'Invalid object type {0}. Expected models.Container'
                 .format(type(container)))
 
-        inst = instrument._instrument
-        log.info('Picking up tip from {} in {} with {}'.format(
-            container.name, container.slot, instrument.name))
+        log.info('Picking up tip from %s in %s with %s',
+                 container.name, container.slot, instrument.name)
         self._set_state('moving')
-        if ff.use_protocol_api_v2():
-            with instrument._context.temp_connect(self._hardware):
-                instrument._context.location_cache = None
-                inst.pick_up_tip(container._container.wells()[0])
-        else:
-            inst.pick_up_tip(container._container.wells()[0])
+        self._ops.pick_up_tip(instrument, container.well0)
         self._set_state('ready')
 
     def drop_tip(self, instrument, container):
@@ -93,51 +89,22 @@ class CalibrationManager:
                 'Invalid object type {0}. Expected models.Container'
                 .format(type(container)))
 
-        inst = instrument._instrument
-        log.info('Dropping tip from {} in {} with {}'.format(
-            container.name, container.slot, instrument.name))
+        log.info('Dropping tip from %s in %s with %s',
+                 container.name, container.slot, instrument.name)
         self._set_state('moving')
-        if ff.use_protocol_api_v2():
-            with instrument._context.temp_connect(self._hardware):
-                instrument._context.location_cache = None
-                inst.drop_tip(container._container.wells()[0])
-        else:
-            inst.drop_tip(container._container.wells()[0])
+        self._ops.drop_tip(instrument, container.well0)
         self._set_state('ready')
 
     def return_tip(self, instrument):
-        inst = instrument._instrument
-        log.info('Returning tip from {}'.format(instrument.name))
+        log.info('Returning tip from %s', instrument.name)
         self._set_state('moving')
-        if ff.use_protocol_api_v2():
-            with instrument._context.temp_connect(self._hardware):
-                instrument._context.location_cache = None
-                inst.return_tip()
-        else:
-            inst.return_tip()
+        self._ops.return_tip(instrument)
         self._set_state('ready')
 
     def move_to_front(self, instrument):
-        inst = instrument._instrument
-        log.info('Moving {}'.format(instrument.name))
+        log.info('Moving %s', instrument.name)
         self._set_state('moving')
-        if ff.use_protocol_api_v2():
-            current = self._hardware.gantry_position(
-                Mount[inst.mount.upper()],
-                critical_point=CriticalPoint.NOZZLE)
-            dest = instrument._context.deck.position_for(5)\
-                                           .point._replace(z=150)
-            self._hardware.move_to(Mount[inst.mount.upper()],
-                                   current,
-                                   critical_point=CriticalPoint.NOZZLE)
-            self._hardware.move_to(Mount[inst.mount.upper()],
-                                   dest._replace(z=current.z),
-                                   critical_point=CriticalPoint.NOZZLE)
-            self._hardware.move_to(Mount[inst.mount.upper()],
-                                   dest, critical_point=CriticalPoint.NOZZLE)
-        else:
-            calibration_functions.move_instrument_for_probing_prep(
-                inst, inst.robot)
+        self._ops.move_to_front(instrument)
         self._set_state('ready')
 
     def move_to(self, instrument, container):
@@ -146,86 +113,222 @@ class CalibrationManager:
                 'Invalid object type {0}. Expected models.Container'
                 .format(type(container)))
 
-        inst = instrument._instrument
-        cont = container._container
-
-        target = cont.wells()[0].top()
+        target = container.well0.top()
 
-        log.info('Moving {} to {} in {}'.format(
-            instrument.name, container.name, container.slot))
+        log.info('Moving %s to %s in %s',
+                 instrument.name, container.name, container.slot)
         self._set_state('moving')
-
-        if ff.use_protocol_api_v2():
-            with instrument._context.temp_connect(self._hardware):
-                instrument._context.location_cache = None
-                inst.move_to(target)
-        else:
-            inst.move_to(target)
-
+        self._ops.move_to(instrument, target)
         self._set_state('ready')
 
     def jog(self, instrument, distance, axis):
-        inst = instrument._instrument
-        log.info('Jogging {} by {} in {}'.format(
-            instrument.name, distance, axis))
+        log.info('Jogging %s by %s in %s',
+                 instrument.name, distance, axis)
         self._set_state('moving')
-        if ff.use_protocol_api_v2():
-            self._hardware.move_rel(
-                Mount[inst.mount.upper()], Point(**{axis: distance}))
-        else:
-            calibration_functions.jog_instrument(
-                instrument=inst,
-                distance=distance,
-                axis=axis,
-                robot=inst.robot)
+        self._ops.jog(instrument, distance, axis)
         self._set_state('ready')
 
     def home(self, instrument):
-        inst = instrument._instrument
-        log.info('Homing {}'.format(instrument.name))
+        log.info('Homing %s', instrument.name)
         self._set_state('moving')
-        if ff.use_protocol_api_v2():
-            with instrument._context.temp_connect(self._hardware):
-                instrument._context.location_cache = None
-                inst.home()
-        else:
-            inst.home()
+        self._ops.home(instrument)
         self._set_state('ready')
 
     def update_container_offset(self, container, instrument):
-        inst = instrument._instrument
-        log.info('Updating {} in {}'.format(container.name, container.slot))
-        if ff.use_protocol_api_v2():
-            if 'centerMultichannelOnWells' in container._container.quirks:
-                cp = CriticalPoint.XY_CENTER
-            else:
-                cp = None
-            here = self._hardware.gantry_position(Mount[inst.mount.upper()],
-                                                  critical_point=cp)
-            # Reset calibration so we don’t actually calibrate the offset
-            # relative to the old calibration
-            container._container.set_calibration(Point(0, 0, 0))
-            if ff.calibrate_to_bottom():
-                orig = container._container.wells()[0].bottom().point
-            else:
-                orig = container._container.wells()[0].top().point
-            delta = here - orig
-            labware.save_calibration(container._container, delta)
-        else:
-            inst.robot.calibrate_container_with_instrument(
-                container=container._container,
-                instrument=inst,
-                save=True
-            )
+        log.info('Updating %s in %s', container.name, container.slot)
+        self._ops.update_container_offset(container, instrument)
+        # Recalibrating can rebuild the labware's wells
+        container.invalidate_first_well()
 
     def _snapshot(self):
         return {
             'topic': CalibrationManager.TOPIC,
             'name': 'state',
-            'payload': copy(self)
+            'payload': {'state': self.state}
         }
 
     def _on_state_changed(self):
-        self._hardware._use_safest_height = (self.state in
-                                             ['probing', 'moving'])
-        self._broker.publish(CalibrationManager.TOPIC, self._snapshot())
+        self._hardware._use_safest_height = self.state in _SAFE_STATES
+        if self._loop is not None:
+            # Deliver to subscribers from the event loop rather than holding
+            # up the calibration action (which may be on another thread)
+            self._loop.call_soon_threadsafe(
+                self._broker.publish, CalibrationManager.TOPIC,
+                self._snapshot())
+        else:
+            self._broker.publish(CalibrationManager.TOPIC, self._snapshot())
+
+
+class _V1Ops:
+    """ Calibration actions for protocol api v1, which go through the
+    instrument's robot
+    """
+    def begin_session(self, instrument):
+        pass
+
+    def end_session(self):
+        pass
+
+    def locate_tip_probe_center(self, instrument):
+        inst = instrument._instrument
+        return calibration_functions.probe_instrument(
+            instrument=inst,
+            robot=inst.robot)
+
+    def update_instrument_config(self, instrument, measured_center):
+        return calibration_functions.update_instrument_config(
+            instrument=instrument._instrument,
+            measured_center=measured_center)
+
+    def pick_up_tip(self, instrument, well):
+        instrument._instrument.pick_up_tip(well)
+
+    def drop_tip(self, instrument, well):
+        instrument._instrument.drop_tip(well)
+
+    def return_tip(self, instrument):
+        instrument._instrument.return_tip()
+
+    def move_to_front(self, instrument):
+        inst = instrument._instrument
+        calibration_functions.move_instrument_for_probing_prep(
+            inst, inst.robot)
+
+    def move_to(self, instrument, target):
+        instrument._instrument.move_to(target)
+
+    def jog(self, instrument, distance, axis):
+        inst = instrument._instrument
+        calibration_functions.jog_instrument(
+            instrument=inst,
+            distance=distance,
+            axis=axis,
+            robot=inst.robot)
+
+    def home(self, instrument):
+        instrument._instrument.home()
+
+    def update_container_offset(self, container, instrument):
+        inst = instrument._instrument
+        inst.robot.calibrate_container_with_instrument(
+            container=container._container,
+            instrument=inst,
+            save=True
+        )
+
+
+class _V2Ops:
+    """ Calibration actions for protocol api v2, which go through the
+    hardware controller
+    """
+    def __init__(self, hardware):
+        self._hardware = hardware
+        self._mounts: WeakKeyDictionary = WeakKeyDictionary()
+        # The protocol context and temp_connect held open by begin_session
+        self._session_context = None
+        self._session_connection = None
+
+    def begin_session(self, instrument):
+        self.end_session()
+        connection = instrument._context.temp_connect(self._hardware)
+        connection.__enter__()
+        self._session_context = instrument._context
+        self._session_connection = connection
+
+    def end_session(self):
+        connection = self._session_connection
+        self._session_context = None
+        self._session_connection = None
+        if connection is not None:
+            connection.__exit__(None, None, None)
+
+    @contextmanager
+    def _connected(self, instrument):
+        if instrument._context is self._session_context:
+            yield
+        else:
+            with instrument._context.temp_connect(self._hardware):
+                yield
+
+    def _mount_for(self, instrument):
+        try:
+            return self._mounts[instrument]
+        except KeyError:
+            mount = Mount[instrument._instrument.mount.upper()]
+            self._mounts[instrument] = mount
+            return mount
+
+    def locate_tip_probe_center(self, instrument):
+        assert instrument.tip_racks,\
+            'No known tipracks for {}'.format(instrument)
+        tip_length = instrument.tip_racks[0]._container.tip_length
+        return self._hardware.locate_tip_probe_center(
+            self._mount_for(instrument), tip_length)
+
+    def update_instrument_config(self, instrument, measured_center):
+        self._hardware.update_instrument_offset(
+            self._mount_for(instrument),
+            from_tip_probe=measured_center)
+        return self._hardware.config
+
+    def pick_up_tip(self, instrument, well):
+        with self._connected(instrument):
+            instrument._context.location_cache = None
+            instrument._instrument.pick_up_tip(well)
+
+    def drop_tip(self, instrument, well):
+        with self._connected(instrument):
+            instrument._context.location_cache = None
+            instrument._instrument.drop_tip(well)
+
+    def return_tip(self, instrument):
+        with self._connected(instrument):
+            instrument._context.location_cache = None
+            instrument._instrument.return_tip()
+
+    def move_to_front(self, instrument):
+        mount = self._mount_for(instrument)
+        current = self._hardware.gantry_position(
+            mount,
+            critical_point=CriticalPoint.NOZZLE)
+        dest = instrument._context.deck.position_for(5)\
+                                       .point._replace(z=150)
+        self._hardware.move_path(mount,
+                                 [current,
+                                  dest._replace(z=current.z),
+                                  dest],
+                                 critical_point=CriticalPoint.NOZZLE)
+
+    def move_to(self, instrument, target):
+        with self._connected(instrument):
+            instrument._context.location_cache = None
+            instrument._instrument.move_to(target)
+
+    def jog(self, instrument, distance, axis):
+        self._hardware.move_rel(
+            self._mount_for(instrument), Point(**{axis: distance}))
+
+    def home(self, instrument):
+        with self._connected(instrument):
+            instrument._context.location_cache = None
+            instrument._instrument.home()
+
+    def update_container_offset(self, container, instrument):
+        if 'centerMultichannelOnWells' in container._container.quirks:
+            cp = CriticalPoint.XY_CENTER
+        else:
+            cp = None
+        here = self._hardware.gantry_position(self._mount_for(instrument),
+                                              critical_point=cp)
+        # Reset calibration so we don’t actually calibrate the offset
+        # relative to the old calibration
+        container._container.set_calibration(Point(0, 0, 0))
+        if ff.calibrate_to_bottom():
+            orig = container._container.wells()[0].bottom().point
+        else:
+            orig = container._container.wells()[0].top().point
+        delta = here - orig
+        labware.save_calibration(container._container, delta)
+
+
+_Ops = Union[_V1Ops, _V2Ops]
@@ -16,6 +16,7 @@ class Container:
         instruments = instruments or []
         self._container = container
         self._context = context
+        self._well0 = None
         self.id = id(container)
 
         if isinstance(container, placeable.Placeable):
@@ -30,6 +31,18 @@ class Container:
             Instrument(instrument)
             for instrument in instruments]
 
+    @property
+    def well0(self):
+        """ The container's first well, looked up on first use """
+        if self._well0 is None:
+            self._well0 = self._container.wells()[0]
+        return self._well0
+
+    def invalidate_first_well(self):
+        """ Forget the cached :py:attr:`well0`, e.g. after recalibrating
+        rebuilds the container's wells """
+        self._well0 = None
+
 
 class Instrument:
     def __init__(self, instrument, containers=None, context=None):
@@ -48,4 +48,5 @@ class Broker:
         return unsubscribe
 
     def publish(self, topic, message):
-        [handler(message) for handler in self.subscriptions.get(topic, [])]
+        for handler in self.subscriptions.get(topic, ()):
+            handler(message)
@@ -22,18 +22,31 @@ OT_API_ROBOT_CONFIG_FILE variable.
 This module's interface to the rest of the system are the IS_* attributes and
 the CONFIG attribute.
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import enum
+import functools
 import os
 import json
 import logging
 from pathlib import Path
 import shutil
 import sys
-from typing import Dict, NamedTuple, Optional, Union
+from typing import (Any, Dict, Iterable, Iterator, List, MutableMapping,
+                    NamedTuple, Optional, Union)
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; the stdlib json module is used without it
+    orjson = None  # type: ignore
 
 _CONFIG_FILENAME = 'config.json'
 _LEGACY_INDICES = (Path('/mnt') / 'usbdrive' / 'config' / 'index.json',
                    Path('/data') / 'index.json')
+# The legacy indices are only looked for once per process
+_LEGACY_CACHE_LOADED = False
+_legacy_index_cache: Optional[Dict[str, str]] = None
+_MKDIR_WORKERS = 4
 
 log = logging.getLogger(__file__)
 
@@ -154,7 +167,13 @@ CONFIG_ELEMENTS = (
 #: will change where the API looks for these settings by prepending it to the
 #: normal search path.
 
+_CONFIGS_BY_NAME = {ce.name: ce for ce in CONFIG_ELEMENTS}
+_VALID_NAMES = frozenset(_CONFIGS_BY_NAME)
+_ENV_KEYS = {'OT_API_' + ce.name.upper(): ce.name for ce in CONFIG_ELEMENTS}
+_DEFAULTS = {ce.name: Path(ce.default) for ce in CONFIG_ELEMENTS}
 
+
+@functools.lru_cache(maxsize=1)
 def infer_config_base_dir() -> Path:
     """ Return the directory to store data in.
 
@@ -168,6 +187,9 @@ def infer_config_base_dir() -> Path:
     does exist, it may not contain data, or may require data to be moved
     to it.
 
+    The result is cached for the life of the process (or until
+    :py:meth:`reload`).
+
     :return pathlib.Path: The path to the desired root settings dir.
     """
     if 'OT_API_CONFIG_DIR' in os.environ:
@@ -201,12 +223,17 @@ def load_and_migrate() -> Dict[str, Path]:
     return _ensure_paths_and_types(index)
 
 
-def _load_with_overrides(base) -> Dict[str, str]:
-    """ Load an config or write its defaults """
+def _load_with_overrides(base) -> Dict[str, Path]:
+    """ Load an config or write its defaults
+
+    Values are converted to :py:class:`pathlib.Path` here, once, so the rest
+    of the load only ever deals with paths.
+    """
     should_write = False
     overrides = _get_environ_overrides()
     try:
-        index = json.load((base/_CONFIG_FILENAME).open())
+        index = {key: Path(val) if key in _VALID_NAMES else val
+                 for key, val in _read_json(base/_CONFIG_FILENAME).items()}
     except (OSError, json.JSONDecodeError) as e:
         sys.stderr.write("Error loading config from {}: {}\nRewriting...\n"
                          .format(str(base), e))
@@ -221,7 +248,7 @@ def _load_with_overrides(base) -> Dict[str, str]:
             if key.kind in (ConfigElementType.DIR, ConfigElementType.FILE):
                 index[key.name] = base/key.default
             else:
-                index[key.name] = key.default
+                index[key.name] = Path(key.default)
             should_write = True
 
     if should_write:
@@ -231,43 +258,105 @@ def _load_with_overrides(base) -> Dict[str, str]:
             sys.stderr.write(
                 "Error writing config to {}: {}\nProceeding memory-only\n"
                 .format(str(base), e))
-    index.update(overrides)
+    index.update((key, Path(val)) for key, val in overrides.items())
     return index
 
 
-def _ensure_paths_and_types(index: Dict[str, str]) -> Dict[str, Path]:
+def _ensure_paths_and_types(index: Dict[str, Path]) -> Dict[str, Path]:
     """ Take the direct results of loading the config and make sure
     the filesystem reflects them.
     """
-    configs_by_name = {ce.name: ce for ce in CONFIG_ELEMENTS}
     correct_types: Dict[str, Path] = {}
+    # Several elements share a directory, so collect the unique ones first
+    # and then create them all at once
+    to_make: Dict[Path, None] = OrderedDict()
     for key, item in index.items():
-        if key not in configs_by_name:  # old config, ignore
+        if key not in _CONFIGS_BY_NAME:  # old config, ignore
             continue
-        if configs_by_name[key].kind == ConfigElementType.FILE:
-            it = Path(item)
-            it.parent.mkdir(parents=True, exist_ok=True)
-            correct_types[key] = it
-        elif configs_by_name[key].kind == ConfigElementType.DIR:
-            it = Path(item)
-            it.mkdir(parents=True, exist_ok=True)
-            correct_types[key] = it
+        if _CONFIGS_BY_NAME[key].kind == ConfigElementType.FILE:
+            to_make[item.parent] = None
+            correct_types[key] = item
+        elif _CONFIGS_BY_NAME[key].kind == ConfigElementType.DIR:
+            to_make[item] = None
+            correct_types[key] = item
         else:
             raise RuntimeError(
                 f"unhandled kind in ConfigElements: {key}: "
-                f"{configs_by_name[key].kind}")
+                f"{_CONFIGS_BY_NAME[key].kind}")
+    _make_dirs(to_make.keys())
     return correct_types
 
 
+def _make_dirs(paths: Iterable[Path]):
+    """ Create each of the directories in `paths` (and their parents).
+
+    Usually they all exist already, so first check with one scandir of each
+    parent directory rather than a failing mkdir per path. The remaining
+    mkdirs are independent, so they are spread over a few threads to overlap
+    the filesystem round trips, which are slow on the robot's SD card.
+    """
+    missing = _missing_dirs(paths)
+    if not missing:
+        return
+
+    def _mkdir(path: Path):
+        path.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=_MKDIR_WORKERS) as executor:
+        # list() so that any exception from a worker is raised here
+        list(executor.map(_mkdir, missing))
+
+
+def _missing_dirs(paths: Iterable[Path]) -> List[Path]:
+    """ Return the paths that are not existing directories """
+    by_parent: Dict[Path, List[Path]] = OrderedDict()
+    for path in paths:
+        by_parent.setdefault(path.parent, []).append(path)
+    missing: List[Path] = []
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            # The parent doesn't exist (or can't be listed), so let mkdir
+            # sort it out
+            existing = set()
+        missing.extend(child for child in children
+                       if child.name not in existing)
+    return missing
+
+
 def _get_environ_overrides() -> Dict[str, str]:
     """ Pull any overrides for the config elements from the environ and return
     a mapping from the names to the values (as strings). Config elements that
     are not overridden will not be in the mapping.
     """
-    return {
-        ce.name: os.environ['OT_API_' + ce.name.upper()]
-        for ce in CONFIG_ELEMENTS
-        if 'OT_API_' + ce.name.upper() in os.environ}
+    environ = os.environ
+    return {name: environ[env_key]
+            for env_key, name in _ENV_KEYS.items()
+            if env_key in environ}
+
+
+def _read_json(path: Path) -> Any:
+    """ Parse the json file at `path`, using orjson if it is available.
+
+    Parse errors are always raised as :py:class:`json.JSONDecodeError`
+    (which orjson's errors subclass).
+    """
+    data = path.read_bytes()
+    if orjson:
+        return orjson.loads(data)
+    else:
+        return json.loads(data)
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """ Serialize `data` as indented json, using orjson if it is available
+    """
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        return json.dumps(data, indent=2).encode()
 
 
 def _legacy_index() -> Union[None, Dict[str, str]]:
@@ -277,10 +366,18 @@ def _legacy_index() -> Union[None, Dict[str, str]]:
 
     This method should only be called on a robot.
     """
+    global _LEGACY_CACHE_LOADED, _legacy_index_cache
+    if not _LEGACY_CACHE_LOADED:
+        _legacy_index_cache = _find_legacy_index()
+        _LEGACY_CACHE_LOADED = True
+    return _legacy_index_cache
+
+
+def _find_legacy_index() -> Union[None, Dict[str, str]]:
     for index in _LEGACY_INDICES:
         if index.exists():
             try:
-                return json.load(open(index))
+                return _read_json(index)
             except (OSError, json.JSONDecodeError):
                 return None
     return None
@@ -291,9 +388,11 @@ def _erase_old_indices():
 
     This method should only be called on a robot.
     """
+    global _legacy_index_cache
     for index in _LEGACY_INDICES:
         if index.exists():
             index.unlink()
+    _legacy_index_cache = None
 
 
 def _do_migrate(index: Dict[str, str]):
@@ -320,9 +419,7 @@ def _do_migrate(index: Dict[str, str]):
         new_path = Path(new)
         if old_path.exists() and not old_path.is_symlink():
             sys.stdout.write(f"config migration: {old}->{new}\n")
-            if new_path.is_dir():
-                shutil.rmtree(new_path)
-            shutil.move(old_path, new_path)
+            _migrate_path(old_path, new_path)
         else:
             sys.stdout.write(f"config migration: not moving {old}:")
             sys.stdout.write(f" exists={old_path.exists()}")
@@ -331,6 +428,25 @@ def _do_migrate(index: Dict[str, str]):
     write_config(new_index, base)
 
 
+def _migrate_path(old_path: Path, new_path: Path):
+    """ Move `old_path` to `new_path`, replacing whatever is there.
+
+    When both are on /data this is a single rename. Otherwise (or if the
+    rename fails, for instance because `new_path` is a directory that isn't
+    empty) fall back to removing the destination and a full move.
+    """
+    data = Path('/data')
+    if data in old_path.parents and data in new_path.parents:
+        try:
+            os.replace(old_path, new_path)
+            return
+        except OSError:
+            pass
+    if new_path.is_dir():
+        shutil.rmtree(new_path)
+    shutil.move(str(old_path), str(new_path))
+
+
 def _migrate_robot():
     old_index = _legacy_index()
     if old_index:
@@ -361,19 +477,11 @@ def generate_config_index(defaults: Dict[str, str],
     :returns: The config object
     """
     base = Path(base_dir) if base_dir else infer_config_base_dir()
-
-    def parse_or_default(
-            ce: ConfigElement, val: Optional[str]) -> Path:
-        if not val:
-            return base / Path(ce.default)
-        else:
-            return Path(val)
-
-    return {
-        ce.name: parse_or_default(ce,
-                                  defaults.get(ce.name))
-        for ce in CONFIG_ELEMENTS
-    }
+    index: Dict[str, Path] = {}
+    for name, default in _DEFAULTS.items():
+        val = defaults.get(name)
+        index[name] = Path(val) if val else base/default
+    return index
 
 
 def write_config(config_data: Dict[str, Path],
@@ -385,27 +493,76 @@ def write_config(config_data: Dict[str, Path],
                      :py:meth:`infer_config_base_dir()` will be used
 
     Only keys that are in the config elements will be saved.
+
+    The index is written to a temporary file that then replaces the old one,
+    so losing power partway through leaves either the old or the new index
+    rather than a truncated one.
     """
     path = Path(path) if path else infer_config_base_dir()
-    valid_names = [ce.name for ce in CONFIG_ELEMENTS]
+    tmp = path/(_CONFIG_FILENAME + '.tmp')
     try:
         os.makedirs(path, exist_ok=True)
-        with (path/_CONFIG_FILENAME).open('w') as base_f:
-            json.dump({k: str(v) for k, v in config_data.items()
-                       if k in valid_names},
-                      base_f, indent=2)
+        with tmp.open('wb') as f:
+            f.write(_dump_json({k: str(v) for k, v in config_data.items()
+                                if k in _VALID_NAMES}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path/_CONFIG_FILENAME)
     except OSError as e:
         sys.stderr.write("Config index write to {} failed: {}\n"
                          .format(path/_CONFIG_FILENAME, e))
+        # Don't leave a partial index behind for every failed save
+        if tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+class _LazyConfig(MutableMapping[str, Path]):
+    """ The config index, loaded (and migrated) from disk the first time
+    any of it is accessed rather than when this module is imported.
+
+    Otherwise this behaves like the dict returned by
+    :py:meth:`load_and_migrate`.
+    """
+    def __init__(self) -> None:
+        self._data: Optional[Dict[str, Path]] = None
+
+    def _loaded(self) -> Dict[str, Path]:
+        if self._data is None:
+            self._data = load_and_migrate()
+        return self._data
+
+    def load(self):
+        """ Load the config from disk, replacing anything already loaded """
+        self._data = load_and_migrate()
+
+    def __getitem__(self, key: str) -> Path:
+        return self._loaded()[key]
+
+    def __setitem__(self, key: str, value: Path):
+        self._loaded()[key] = value
+
+    def __delitem__(self, key: str):
+        del self._loaded()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaded())
+
+    def __len__(self) -> int:
+        return len(self._loaded())
+
+    def __repr__(self) -> str:
+        return repr(self._loaded())
 
 
 def reload():
-    global CONFIG
-    CONFIG.clear()
-    CONFIG.update(load_and_migrate())
+    infer_config_base_dir.cache_clear()
+    CONFIG.load()
 
 
-CONFIG = load_and_migrate()
+CONFIG = _LazyConfig()
 #: The currently loaded config. This should not change for the lifetime
-#: of the program. This is a dict much like os.environ() where the keys
-#: are config element names
+#: of the program. This is a mapping much like os.environ() where the keys
+#: are config element names. It is loaded from disk on first access.
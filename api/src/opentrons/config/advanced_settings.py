@@ -83,8 +83,14 @@ settings = [
 settings_by_id = {s.id: s for s in settings}
 settings_by_old_id = {s.old_id: s for s in settings}
 
+_settings_cache: Dict['Path', SettingsData] = {}
+"""
+Parsed contents of settings files, keyed by path. Entries are dropped whenever
+this module writes the file, so the feature flag accessors in
+:py:mod:`opentrons.config.feature_flags` only hit the disk once per file.
+"""
+
 
-# TODO: LRU cache?
 def get_adv_setting(setting: str) -> Optional[bool]:
     setting = _clean_id(setting)
     s = get_all_adv_settings()
@@ -98,7 +104,7 @@ def get_all_adv_settings() -> Dict[str, Dict[str, Union[str, bool, None]]]:
     """
     settings_file = CONFIG['feature_flags_file']
 
-    values, _ = _read_settings_file(settings_file)
+    values, _ = _read_settings_file_cached(settings_file)
 
     return {
         key: {**settings_by_id[key].__dict__,
@@ -134,6 +140,15 @@ def _read_json_file(path: Union[str, 'Path']) -> Dict[str, Any]:
     return data
 
 
+def _read_settings_file_cached(settings_file: 'Path') -> SettingsData:
+    try:
+        return _settings_cache[settings_file]
+    except KeyError:
+        data = _read_settings_file(settings_file)
+        _settings_cache[settings_file] = data
+        return data
+
+
 def _read_settings_file(settings_file: 'Path') -> SettingsData:
     """
     Read the settings file, which is a json object with settings IDs as keys
@@ -159,6 +174,7 @@ def _read_settings_file(settings_file: 'Path') -> SettingsData:
 def _write_settings_file(data: Mapping[str, Any],
                          version: int,
                          settings_file: 'Path'):
+    _settings_cache.pop(settings_file, None)
     try:
         with settings_file.open('w') as fd:
             json.dump({**data, '_version': version}, fd)
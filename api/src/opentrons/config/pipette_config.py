@@ -180,10 +180,14 @@ def piecewise_volume_conversion(
     :return: the ul/mm value for the specified volume
     """
     # pick the first item from the seq for which the target is less than
-    # the bracketing element
-    i = list(filter(lambda x: ul <= x[0], sequence))[0]
-    # use that element to calculate the movement distance in mm
-    return i[1]*ul + i[2]
+    # the bracketing element, and use it to calculate the movement distance
+    # in mm. This runs on every aspirate and dispense, so stop at the first
+    # match rather than filtering the whole sequence.
+    for piece in sequence:
+        if ul <= piece[0]:
+            return piece[1]*ul + piece[2]
+    raise IndexError(
+        '{}ul is above the top of the ul/mm function'.format(ul))
 
 
 def save_overrides(pipette_id: str, overrides: Dict[str, Any]):
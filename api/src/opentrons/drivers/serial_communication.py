@@ -58,15 +58,17 @@ def _write_to_device_and_return(cmd, ack, device_connection):
     - Formats command
     - Wait for ack return
     - return parsed response'''
-    log.debug('Write -> {}'.format(cmd.encode()))
-    device_connection.write(cmd.encode())
-    response = device_connection.read_until(ack.encode())
-    log.debug('Read <- {}'.format(response))
-    if ack.encode() not in response:
+    cmd_bytes = cmd.encode()
+    ack_bytes = ack.encode()
+    log.debug('Write -> %s', cmd_bytes)
+    device_connection.write(cmd_bytes)
+    response = device_connection.read_until(ack_bytes)
+    log.debug('Read <- %s', response)
+    if ack_bytes not in response:
         raise SerialNoResponse(
             'No response from serial port after {} second(s)'.format(
                 device_connection.timeout))
-    clean_response = _parse_serial_response(response, ack.encode())
+    clean_response = _parse_serial_response(response, ack_bytes)
     if clean_response:
         return clean_response.decode()
     return ''
@@ -1147,6 +1147,68 @@ class SmoothieDriver_3_0_0:
 
             self._update_position(target)
 
+    def move_path(self, targets, home_flagged_axes=False):
+        '''
+        Move through each of the Smoothieware coordinates in `targets`, in
+        order. Unlike calling `move()` once per target, all of the segments
+        are sent in a single command, so Smoothieware can plan through the
+        junctions and there is only one wait for motion to complete.
+
+        targets: list of dict
+            Each dict is a target like the one taken by `move()`. Plunger
+            axes may not be included, since they require backlash
+            compensation on every move.
+
+        home_flagged_axes: boolean (default=False)
+            See `move()`.
+        '''
+        from numpy import isclose
+
+        if any(axis in 'BC' for target in targets for axis in target):
+            raise ValueError('move_path cannot move plunger axes')
+
+        self.run_flag.wait()
+
+        position = self.position
+        segments = []
+        moving_axes = set()
+        for target in targets:
+            coords = [
+                axis + str(round(coord, GCODE_ROUNDING_PRECISION))
+                for axis, coord in sorted(target.items())
+                if not ((axis in DISABLE_AXES) or (coord is None)
+                        or isclose(coord, position[axis]))
+            ]
+            if coords:
+                segments.append(GCODES['MOVE'] + ''.join(coords))
+                moving_axes.update(target.keys())
+                position.update({axis: coord for axis, coord in target.items()
+                                 if coord is not None})
+
+        if not segments:
+            return
+
+        non_moving_axes = ''.join([
+            ax
+            for ax in AXES
+            if ax not in moving_axes
+        ])
+        self.dwell_axes(non_moving_axes)
+        self.activate_axes(moving_axes)
+
+        command = self._generate_current_command()
+        command += ' ' + ' '.join(segments)
+
+        for axis in moving_axes:
+            self.engaged_axes[axis] = True
+        if home_flagged_axes:
+            self.home_flagged_axes(''.join(moving_axes))
+        log.debug("move_path: {}".format(command))
+        self._send_command(command, timeout=DEFAULT_MOVEMENT_TIMEOUT)
+
+        for target in targets:
+            self._update_position(target)
+
     def home(self, axis=AXES, disabled=DISABLE_AXES):
 
         self.run_flag.wait()
@@ -26,6 +26,7 @@ GCODES = {
 TC_BAUDRATE = 115200
 
 TC_COMMAND_TERMINATOR = '\r\n\r\n'
+_CMD_SUFFIX = ' ' + TC_COMMAND_TERMINATOR
 TC_ACK = 'ok\r\nok\r\n'
 ERROR_KEYWORD = 'error'
 DEFAULT_TC_TIMEOUT = 1
@@ -93,8 +94,8 @@ class Thermocycler:
         self._send_command('\r\n', timeout=DEFAULT_TC_TIMEOUT)
 
     def _send_command(self, command, timeout=DEFAULT_TC_TIMEOUT):
-        command_line = command + ' ' + TC_COMMAND_TERMINATOR
-        ret_code = self._recursive_write_and_return(
+        command_line = command + _CMD_SUFFIX
+        ret_code = self._write_and_return(
             command_line, timeout, DEFAULT_COMMAND_RETRIES)
         if(ERROR_KEYWORD in ret_code.lower()):
             log.error('Received error message from Thermocycler: {}'.format(
@@ -102,20 +103,29 @@ class Thermocycler:
             raise ThermocyclerError(ret_code)
         return ret_code.strip()
 
-    def _recursive_write_and_return(self, cmd, timeout, retries):
-        try:
-            return serial_communication.write_and_return(
-                cmd,
-                TC_ACK,
-                self._connection,
-                timeout)
-        except SerialNoResponse as e:
-            retries -= 1
-            if retries <= 0:
-                raise e
-            sleep(DEFAULT_STABILIZE_DELAY)
-            if self._connection:
+    def _write_and_return(self, cmd, timeout, retries):
+        """ Write `cmd` and return the response, retrying up to `retries`
+        times in all if the device doesn't respond. At least one attempt is
+        always made.
+
+        The wait between attempts doubles each time, starting from half of
+        DEFAULT_STABILIZE_DELAY, and the port is only reopened before
+        the final attempt.
+        """
+        retries = max(retries, 1)
+        delay = DEFAULT_STABILIZE_DELAY / 2
+        for attempt in range(1, retries + 1):
+            try:
+                return serial_communication.write_and_return(
+                    cmd,
+                    TC_ACK,
+                    self._connection,
+                    timeout)
+            except SerialNoResponse:
+                if attempt >= retries:
+                    raise
+            sleep(delay)
+            delay *= 2
+            if attempt == retries - 1 and self._connection:
                 self._connection.close()
                 self._connection.open()
-            return self._recursive_write_and_return(
-                cmd, timeout, retries)
@@ -11,11 +11,12 @@ functions are available elsewhere.
 """
 
 import asyncio
-from collections import OrderedDict
 import contextlib
 import functools
 import logging
+import threading
 from typing import Any, Dict, Union, List, Optional, Tuple
+import numpy as np
 from opentrons import types as top_types
 from opentrons.util import linal
 from .simulator import Simulator
@@ -32,12 +33,33 @@ from .types import Axis, HardwareAPILike, CriticalPoint
 
 mod_log = logging.getLogger(__name__)
 PICK_UP_SPEED = 30
+# For membership checks on the motion path
+_GANTRY_AXES = frozenset(Axis.gantry_axes())
+# Smoothie axis names to Axis, without going through Enum.__getitem__
+_AXIS_BY_NAME: Dict[str, Axis] = {ax.name: ax for ax in Axis}
+_LEFT_Z = Axis.by_mount(top_types.Mount.LEFT)
+_RIGHT_Z = Axis.by_mount(top_types.Mount.RIGHT)
+# Shared null offset; Points are immutable so a single instance is enough
+_ZERO_POINT = top_types.Point(0, 0, 0)
+# Unit vectors along each deck axis, for building single-axis moves
+_AXIS_UNIT = {'x': top_types.Point(1, 0, 0),
+              'y': top_types.Point(0, 1, 0),
+              'z': top_types.Point(0, 0, 1)}
+# Plunger targets closer than this (mm) to the current position are no-ops
+_PLUNGER_TOLERANCE = 1e-4
+# Smoothie axis names to home when homing everything
+_ALL_AXIS_NAMES = [ax.name for ax in Axis]
 
 
 def _log_call(func):
+    name = func.__name__
+
     @functools.wraps(func)
     def _log_call_inner(*args, **kwargs):
-        args[0]._log.debug(func.__name__)
+        log = args[0]._log
+        # Skip building a log record per call unless debug logging is on
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(name)
         return func(*args, **kwargs)
     return _log_call_inner
 
@@ -70,6 +92,17 @@ class API(HardwareAPILike):
 
     CLS_LOG = mod_log.getChild('API')
 
+    # Slots for the state read on every motion call. HardwareAPILike is
+    # deliberately left without slots, so instances keep a __dict__ for
+    # attributes attached from outside (and for monkeypatching in tests).
+    __slots__ = ('_log', '_config', '_gantry_cal_source', '_gantry_fwd',
+                 '_gantry_inv', '_mount_offset_source', '_mount_offsets',
+                 '_backend', '_bounds_by_axis', '_loop', '_lock',
+                 '_current_position', '_gantry_pos_cache',
+                 '_attached_instruments',
+                 '_attached_instruments_cache', '_attached_modules',
+                 '_last_moved_mount', '_motion_lock')
+
     def __init__(self,
                  backend: _Backend,
                  config: robot_configs.robot_config = None,
@@ -82,26 +115,51 @@ class API(HardwareAPILike):
         """
         self._log = self.CLS_LOG.getChild(str(id(self)))
         self._config = config or robot_configs.load()
+        # The deck calibration transform and its inverse, kept alongside the
+        # calibration they were computed from
+        self._gantry_cal_source = None
+        self._gantry_fwd = np.identity(4)
+        self._gantry_inv = np.identity(4)
+        # Per-mount offsets, kept alongside the config value they came from
+        self._mount_offset_source = None
+        self._mount_offsets: Dict[top_types.Mount, top_types.Point] = {}
         self._backend = backend
+        # The backend's axis bounds can move when it homes, so this is reset
+        # to None after every home
+        self._bounds_by_axis: Optional[
+            Dict[Axis, Tuple[float, float]]] = None
         if None is loop:
             self._loop = asyncio.get_event_loop()
         else:
             self._loop = loop
         # {'X': 0.0, 'Y': 0.0, 'Z': 0.0, 'A': 0.0, 'B': 0.0, 'C': 0.0}
         self._current_position: Dict[Axis, float] = {}
+        # (mount, critical point) -> (position, mount offset, critical point
+        # offset, result) for gantry_position
+        self._gantry_pos_cache: Dict[
+            Tuple[top_types.Mount, Optional[CriticalPoint]],
+            Tuple[Dict[Axis, float], top_types.Point, top_types.Point,
+                  top_types.Point]] = {}
 
         self._attached_instruments: Instruments = {
             top_types.Mount.LEFT: None,
             top_types.Mount.RIGHT: None
         }
-        self._attached_modules: Dict[str, Any] = {}
+        # The snapshot served by attached_instruments; reset to None by
+        # anything that changes the state of an attached pipette
+        self._attached_instruments_cache: Optional[
+            Dict[top_types.Mount, Dict[str, Any]]] = None
+        # Keyed by (port, model)
+        self._attached_modules: Dict[Tuple[str, str], Any] = {}
         self._last_moved_mount: Optional[top_types.Mount] = None
         # The motion lock synchronizes calls to long-running physical tasks
-        # involved in motion. This fixes issue where for instance a move()
-        # or home() call is in flight and something else calls
-        # current_position(), which will not be updated until the move() or
-        # home() call succeeds or fails.
-        self._motion_lock = asyncio.Lock(loop=self._loop)
+        # involved in motion. Nothing is awaited while it is held (the
+        # backend calls are synchronous), so it is a plain thread lock; that
+        # also serializes motion started from another thread's event loop.
+        # Position reads don't take it: every motion call replaces
+        # _current_position with a new dict once the backend returns, so a
+        # reader always sees a complete position.
+        self._motion_lock = threading.Lock()
 
     @classmethod
     async def build_hardware_controller(
@@ -217,15 +275,18 @@ class API(HardwareAPILike):
 
         :param int duration_s: The duration to blink for, in seconds.
         """
-        count = duration_s * 4
+        # The button light is driven over gpio, so the blinking has to be
+        # timed here. Sleep until each toggle is due rather than measuring
+        # every iteration, so the blink rate does not drift.
+        period = 0.25
         on = False
-        for sec in range(count):
-            then = self._loop.time()
-            self.set_lights(button=on)
+        due = self._loop.time()
+        for _ in range(duration_s * 4):
+            self._backend.set_lights(on, None)
             on = not on
-            now = self._loop.time()
-            await asyncio.sleep(max(0, 0.25-(now-then)))
-        self.set_lights(button=True)
+            due += period
+            await asyncio.sleep(max(0, due - self._loop.time()))
+        self._backend.set_lights(True, None)
 
     @_log_call
     async def cache_instruments(self,
@@ -252,11 +313,14 @@ class API(HardwareAPILike):
                 self._attached_instruments[mount] = p
             else:
                 self._attached_instruments[mount] = None
+        self._attached_instruments_cache = None
         mod_log.info("Instruments found: {}".format(
             self._attached_instruments))
 
     @property
     def attached_instruments(self):
+        if self._attached_instruments_cache is not None:
+            return self._attached_instruments_cache
         configs = ['name', 'min_volume', 'max_volume', 'channels',
                    'aspirate_flow_rate', 'dispense_flow_rate',
                    'pipette_id', 'current_volume', 'display_name',
@@ -271,6 +335,7 @@ class API(HardwareAPILike):
             for key in configs:
                 instruments[mount][key] = instr_dict[key]
             instruments[mount]['has_tip'] = instr.has_tip
+        self._attached_instruments_cache = instruments
         return instruments
 
     @property
@@ -378,40 +443,38 @@ class API(HardwareAPILike):
                      home everything.
         """
         # Initialize/update current_position
-        checked_axes = axes or [ax for ax in Axis]
-        gantry = [ax for ax in checked_axes if ax in Axis.gantry_axes()]
-        smoothie_gantry = [ax.name.upper() for ax in gantry]
-        smoothie_pos = {}
-        plungers = [ax for ax in checked_axes
-                    if ax not in Axis.gantry_axes()]
-        smoothie_plungers = [ax.name.upper() for ax in plungers]
-        async with self._motion_lock:
-            if smoothie_gantry:
-                smoothie_pos.update(self._backend.home(smoothie_gantry))
-            if smoothie_plungers:
-                smoothie_pos.update(self._backend.home(smoothie_plungers))
+        if axes:
+            smoothie_axes = [ax.name for ax in axes]
+        else:
+            smoothie_axes = _ALL_AXIS_NAMES
+        with self._motion_lock:
+            # Home gantry and plunger axes in one backend call; the driver
+            # sequences them safely (plungers and z before x and y)
+            smoothie_pos = self._backend.home(smoothie_axes)
+            self._bounds_by_axis = None
             self._current_position = self._deck_from_smoothie(smoothie_pos)
+        last = self._last_moved_mount
+        if last and Axis.by_mount(last).name in smoothie_axes:
+            # Its z is already up, so don't retract it again on the next
+            # mount switch
+            self._last_moved_mount = None
 
     def add_tip(
             self,
             mount: top_types.Mount,
             tip_length: float):
         instr = self._attached_instruments[mount]
-        instr_dict = self.attached_instruments[mount]
         if instr and not instr.has_tip:
             instr.add_tip(tip_length=tip_length)
-            instr_dict['has_tip'] = True
-            instr_dict['tip_length'] = tip_length
+            self._attached_instruments_cache = None
         else:
             mod_log.warning('attach tip called while tip already attached')
 
     def remove_tip(self, mount: top_types.Mount):
         instr = self._attached_instruments[mount]
-        instr_dict = self.attached_instruments[mount]
         if instr and instr.has_tip:
             instr.remove_tip()
-            instr_dict['has_tip'] = False
-            instr_dict['tip_length'] = 0.0
+            self._attached_instruments_cache = None
         else:
             mod_log.warning('detach tip called with no tip')
 
@@ -434,26 +497,25 @@ class API(HardwareAPILike):
               on the deck) it has to go through the reverse transform to be
               added to the smoothie coordinates here.
         """
-        with_enum = {Axis[k]: v for k, v in smoothie_pos.items()}
-        plunger_axes = {k: v for k, v in with_enum.items()
-                        if k not in Axis.gantry_axes()}
-        right = (with_enum[Axis.X], with_enum[Axis.Y],
-                 with_enum[Axis.by_mount(top_types.Mount.RIGHT)])
+        x = smoothie_pos[Axis.X.name]
+        y = smoothie_pos[Axis.Y.name]
+        right = (x, y, smoothie_pos[_RIGHT_Z.name])
         # Tell apply_transform to just do the change of base part of the
         # transform rather than the full affine transform, because this is
         # an offset
-        left = (with_enum[Axis.X],
-                with_enum[Axis.Y],
-                with_enum[Axis.by_mount(top_types.Mount.LEFT)])
-        right_deck = linal.apply_reverse(self.config.gantry_calibration,
-                                         right)
-        left_deck = linal.apply_reverse(self.config.gantry_calibration,
-                                        left)
+        left = (x, y, smoothie_pos[_LEFT_Z.name])
+        _, gantry_inv = self._gantry_transforms()
+        right_deck, left_deck = linal.apply_transform_batch(
+            gantry_inv, (right, left))
         deck_pos = {Axis.X: right_deck[0],
                     Axis.Y: right_deck[1],
-                    Axis.by_mount(top_types.Mount.RIGHT): right_deck[2],
-                    Axis.by_mount(top_types.Mount.LEFT): left_deck[2]}
-        deck_pos.update(plunger_axes)
+                    _RIGHT_Z: right_deck[2],
+                    _LEFT_Z: left_deck[2]}
+        # The plunger axes pass through untransformed
+        for name, val in smoothie_pos.items():
+            ax = _AXIS_BY_NAME[name]
+            if ax not in _GANTRY_AXES:
+                deck_pos[ax] = val
         return deck_pos
 
     async def current_position(
@@ -474,22 +536,19 @@ class API(HardwareAPILike):
         specified mount but `CriticalPoint.TIP` was specified, the position of
         the nozzle will be returned.
         """
-        if not self._current_position:
+        position = self._current_position
+        if not position:
             raise MustHomeError
-        async with self._motion_lock:
-            if mount == mount.RIGHT:
-                offset = top_types.Point(0, 0, 0)
-            else:
-                offset = top_types.Point(*self.config.mount_offset)
-            z_ax = Axis.by_mount(mount)
-            plunger_ax = Axis.of_plunger(mount)
-            cp = self._critical_point_for(mount, critical_point)
-            return {
-                Axis.X: self._current_position[Axis.X] + offset[0] + cp.x,
-                Axis.Y: self._current_position[Axis.Y] + offset[1] + cp.y,
-                z_ax: self._current_position[z_ax] + offset[2] + cp.z,
-                plunger_ax: self._current_position[plunger_ax]
-            }
+        offset = self._mount_offset(mount)
+        z_ax = Axis.by_mount(mount)
+        plunger_ax = Axis.of_plunger(mount)
+        cp = self._critical_point_for(mount, critical_point)
+        return {
+            Axis.X: position[Axis.X] + offset[0] + cp.x,
+            Axis.Y: position[Axis.Y] + offset[1] + cp.y,
+            z_ax: position[z_ax] + offset[2] + cp.z,
+            plunger_ax: position[plunger_ax]
+        }
 
     async def gantry_position(
             self,
@@ -502,11 +561,27 @@ class API(HardwareAPILike):
 
         `critical_point` specifies an override to the current critical point to
         use (see :py:meth:`current_position`).
+
+        The result is reused until the position, the mount offset or the
+        critical point changes. Every motion replaces the position dict, so
+        its identity serves as the position's version.
         """
-        cur_pos = await self.current_position(mount, critical_point)
-        return top_types.Point(x=cur_pos[Axis.X],
-                               y=cur_pos[Axis.Y],
-                               z=cur_pos[Axis.by_mount(mount)])
+        position = self._current_position
+        if not position:
+            raise MustHomeError
+        offset = self._mount_offset(mount)
+        cp = self._critical_point_for(mount, critical_point)
+        key = (mount, critical_point)
+        cached = self._gantry_pos_cache.get(key)
+        if cached and cached[0] is position and cached[1] is offset\
+           and cached[2] == cp:
+            return cached[3]
+        z_ax = Axis.by_mount(mount)
+        point = top_types.Point(x=position[Axis.X] + offset.x + cp.x,
+                                y=position[Axis.Y] + offset.y + cp.y,
+                                z=position[z_ax] + offset.z + cp.z)
+        self._gantry_pos_cache[key] = (position, offset, cp, point)
+        return point
 
     @_log_call
     async def move_to(
@@ -548,19 +623,66 @@ class API(HardwareAPILike):
             raise MustHomeError
 
         await self._cache_and_maybe_retract_mount(mount)
+        target_position = self._mount_target(
+            mount, abs_position, critical_point)
+        await self._move(target_position, speed=speed)
+
+    @_log_call
+    async def move_path(
+            self, mount: top_types.Mount, path: List[top_types.Point],
+            speed: float = None,
+            critical_point: CriticalPoint = None):
+        """ Move the critical point of the specified mount through each of
+        the points in `path`, in order.
+
+        This is equivalent to calling :py:meth:`move_to` with each point, but
+        the whole path is sent to the backend at once, so the motion
+        controller can run the segments back to back rather than stopping to
+        acknowledge each one.
+
+        :param mount: The mount to move
+        :param path: The absolute positions in
+                     :ref:`protocol-api-deck-coords` to move the critical
+                     point through
+        :param speed: An overall head speed to use during the move
+        :param critical_point: The critical point to move. See
+                               :py:meth:`move_to`.
+        """
+        if not self._current_position:
+            raise MustHomeError
+        if not path:
+            return
+
+        await self._cache_and_maybe_retract_mount(mount)
+        target_positions = [
+            self._mount_target(mount, point, critical_point)
+            for point in path]
+        smoothie_positions = [self._smoothie_target(target)
+                              for target in target_positions]
+        with self._motion_lock:
+            try:
+                self._backend.move_path(smoothie_positions, speed=speed)
+            except Exception:
+                self._log.exception('Move failed')
+                self._current_position = {}
+                raise
+            else:
+                self._current_position = {**self._current_position,
+                                          **target_positions[-1]}
+
+    def _mount_target(
+            self, mount: top_types.Mount, abs_position: top_types.Point,
+            critical_point: CriticalPoint = None)\
+            -> Dict[Axis, float]:
+        """ Build the deck-frame axis target that puts the critical point of
+        `mount` at `abs_position`.
+        """
         z_axis = Axis.by_mount(mount)
-        if mount == top_types.Mount.LEFT:
-            offset = top_types.Point(*self.config.mount_offset)
-        else:
-            offset = top_types.Point(0, 0, 0)
+        offset = self._mount_offset(mount)
         cp = self._critical_point_for(mount, critical_point)
-        target_position = OrderedDict(
-            ((Axis.X, abs_position.x - offset.x - cp.x),
-             (Axis.Y, abs_position.y - offset.y - cp.y),
-             (z_axis, abs_position.z - offset.z - cp.z))
-        )
-
-        await self._move(target_position, speed=speed)
+        return {Axis.X: abs_position.x - offset.x - cp.x,
+                Axis.Y: abs_position.y - offset.y - cp.y,
+                z_axis: abs_position.z - offset.z - cp.z}
 
     @_log_call
     async def move_rel(self, mount: top_types.Mount, delta: top_types.Point,
@@ -577,14 +699,10 @@ class API(HardwareAPILike):
 
         z_axis = Axis.by_mount(mount)
         try:
-            target_position = OrderedDict(
-                ((Axis.X,
-                  self._current_position[Axis.X] + delta.x),
-                 (Axis.Y,
-                  self._current_position[Axis.Y] + delta.y),
-                 (z_axis,
-                  self._current_position[z_axis] + delta.z))
-                )
+            target_position = {
+                Axis.X: self._current_position[Axis.X] + delta.x,
+                Axis.Y: self._current_position[Axis.Y] + delta.y,
+                z_axis: self._current_position[z_axis] + delta.z}
         except KeyError:
             raise MustHomeError
         await self._move(target_position, speed=speed)
@@ -596,8 +714,12 @@ class API(HardwareAPILike):
         (and :py:attr:`_last_moved_mount` exists) then retract the mount
         in :py:attr:`_last_moved_mount`. Also unconditionally update
         :py:attr:`_last_moved_mount` to contain `mount`.
+
+        :py:attr:`_last_moved_mount` is cleared whenever that mount is
+        retracted or its z axis is homed, so a mount that is already up is
+        not retracted again.
         """
-        if mount != self._last_moved_mount and self._last_moved_mount:
+        if mount is not self._last_moved_mount and self._last_moved_mount:
             await self.retract(self._last_moved_mount, 10)
         self._last_moved_mount = mount
 
@@ -605,21 +727,22 @@ class API(HardwareAPILike):
                             speed: float = None):
         z_axis = Axis.by_mount(mount)
         pl_axis = Axis.of_plunger(mount)
-        all_axes_pos = OrderedDict(
-            ((Axis.X,
-              self._current_position[Axis.X]),
-             (Axis.Y,
-              self._current_position[Axis.Y]),
-             (z_axis,
-              self._current_position[z_axis]),
-             (pl_axis, dist))
-        )
+        here = self._current_position.get(pl_axis)
+        if here is not None and abs(here - dist) < _PLUNGER_TOLERANCE:
+            # Already there (e.g. at bottom after a full dispense); skip the
+            # round trip to the motor controller
+            return
+        all_axes_pos = {
+            Axis.X: self._current_position[Axis.X],
+            Axis.Y: self._current_position[Axis.Y],
+            z_axis: self._current_position[z_axis],
+            pl_axis: dist}
         try:
             await self._move(all_axes_pos, speed, False)
         except KeyError:
             raise MustHomeError
 
-    async def _move(self, target_position: 'OrderedDict[Axis, float]',
+    async def _move(self, target_position: Dict[Axis, float],
                     speed: float = None, home_flagged_axes: bool = True):
         """ Worker function to apply robot motion.
 
@@ -627,21 +750,43 @@ class API(HardwareAPILike):
         i.e. only one pipette plunger and mount move at the same time, and an
         XYZ move in the coordinate frame of one of the pipettes.
 
-        ``target_position`` should be an ordered dict (ordered by XYZABC)
+        ``target_position`` should be a dict ordered by XYZABC
         of deck calibrated values, containing any specified XY motion and
         at most one of a ZA or BC components. The frame in which to move
         is identified by the presence of (ZA) or (BC).
         """
-        # Transform only the x, y, and (z or a) axes specified since this could
-        # get the b or c axes as well
-        to_transform = tuple((tp
-                              for ax, tp in target_position.items()
-                              if ax in Axis.gantry_axes()))
+        smoothie_pos = self._smoothie_target(target_position)
+        with self._motion_lock:
+            try:
+                self._backend.move(smoothie_pos, speed=speed,
+                                   home_flagged_axes=home_flagged_axes)
+            except Exception:
+                self._log.exception('Move failed')
+                self._current_position = {}
+                raise
+            else:
+                self._current_position = {**self._current_position,
+                                          **target_position}
 
-        # Pre-fill the dict we’ll send to the backend with the axes we don’t
-        # need to transform
-        smoothie_pos = {ax.name: pos for ax, pos in target_position.items()
-                        if ax not in Axis.gantry_axes()}
+    def _smoothie_target(
+            self,
+            target_position: Dict[Axis, float]) -> Dict[str, float]:
+        """ Transform a deck-frame target (see :py:meth:`_move`) into the
+        smoothie-frame position dict to send to the backend, warning about
+        any axes that would go out of bounds.
+        """
+        # Split the target in one pass: the x, y, and (z or a) axes go
+        # through the gantry transform, and everything else (the b or c
+        # axes) is passed straight on to the backend
+        gantry_axes: List[Axis] = []
+        to_transform: List[float] = []
+        smoothie_pos: Dict[str, float] = {}
+        for ax, tp in target_position.items():
+            if ax in _GANTRY_AXES:
+                gantry_axes.append(ax)
+                to_transform.append(tp)
+            else:
+                smoothie_pos[ax.name] = tp
 
         # We’d better have all of (x, y, (z or a)) or none of them since the
         # gantry transform requires them all
@@ -652,53 +797,47 @@ class API(HardwareAPILike):
                              "(z or a) or none of them")
 
         # Type ignored below because linal.apply_transform (rightly) specifies
-        # Tuple[float, float, float] and the implied type from
-        # target_position.items() is (rightly) Tuple[float, ...] with unbounded
-        # size; unfortunately, mypy can’t quite figure out the length check
-        # above that makes this OK
+        # Tuple[float, float, float] and mypy can’t quite figure out the
+        # length check above that makes this list OK
+        gantry_fwd, _ = self._gantry_transforms()
         transformed = linal.apply_transform(  # type: ignore
-            self.config.gantry_calibration, to_transform)
-
-        # Since target_position is an OrderedDict with the axes ordered by
-        # (x, y, z, a, b, c), and we’ll only have one of a or z (as checked
-        # by the len(to_transform) check above) we can use an enumerate to
-        # fuse the specified axes and the transformed values back together.
-        # While we do this iteration, we’ll also check axis bounds.
-        bounds = self._backend.axis_bounds
-        for idx, ax in enumerate(target_position.keys()):
-            if ax in Axis.gantry_axes():
-                smoothie_pos[ax.name] = transformed[idx]
-                if smoothie_pos[ax.name] < bounds[ax.name][0]\
-                   or smoothie_pos[ax.name] > bounds[ax.name][1]:
-                    deck_mins = self._deck_from_smoothie({ax: bound[0]
-                                                          for ax, bound
-                                                          in bounds.items()})
-                    deck_max = self._deck_from_smoothie({ax: bound[1]
-                                                         for ax, bound
-                                                         in bounds.items()})
-                    self._log.warning(
-                        "Out of bounds move: {}={} (transformed: {}) not in"
-                        "limits ({}, {}) (transformed: ({}, {})"
-                        .format(ax.name,
-                                target_position[ax],
-                                smoothie_pos[ax.name],
-                                deck_mins[ax], deck_max[ax],
-                                bounds[ax.name][0], bounds[ax.name][1]))
-        async with self._motion_lock:
-            try:
-                self._backend.move(smoothie_pos, speed=speed,
-                                   home_flagged_axes=home_flagged_axes)
-            except Exception:
-                self._log.exception('Move failed')
-                self._current_position.clear()
-                raise
-            else:
-                self._current_position.update(target_position)
+            gantry_fwd, to_transform)
+
+        # Fuse the gantry axes and their transformed values back together,
+        # checking axis bounds as we go
+        bounds = self._axis_bounds()
+        for ax, val in zip(gantry_axes, transformed):
+            smoothie_pos[ax.name] = val
+            lo, hi = bounds[ax]
+            if val < lo or val > hi:
+                deck_mins = self._deck_from_smoothie(
+                    {bax.name: bound[0] for bax, bound in bounds.items()})
+                deck_max = self._deck_from_smoothie(
+                    {bax.name: bound[1] for bax, bound in bounds.items()})
+                self._log.warning(
+                    "Out of bounds move: {}={} (transformed: {}) not in"
+                    "limits ({}, {}) (transformed: ({}, {})"
+                    .format(ax.name,
+                            target_position[ax],
+                            val,
+                            deck_mins[ax], deck_max[ax],
+                            lo, hi))
+        return smoothie_pos
+
+    def _axis_bounds(self) -> Dict[Axis, Tuple[float, float]]:
+        """ The backend's (minimum, maximum) bounds for each gantry axis,
+        rebuilt only after the backend homes.
+        """
+        if self._bounds_by_axis is None:
+            self._bounds_by_axis = {
+                _AXIS_BY_NAME[ax]: bound
+                for ax, bound in self._backend.axis_bounds.items()}
+        return self._bounds_by_axis
 
     @property
     def engaged_axes(self) -> Dict[Axis, bool]:
         """ Which axes are engaged and holding. """
-        return {Axis[ax]: eng
+        return {_AXIS_BY_NAME[ax]: eng
                 for ax, eng in self._backend.engaged_axes().items()}
 
     async def disengage_axes(self, which: List[Axis]):
@@ -710,10 +849,13 @@ class API(HardwareAPILike):
 
         Works regardless of critical point or home status.
         """
-        smoothie_ax = Axis.by_mount(mount).name.upper()
-        async with self._motion_lock:
+        smoothie_ax = Axis.by_mount(mount).name
+        with self._motion_lock:
             smoothie_pos = self._backend.fast_home(smoothie_ax, margin)
+            self._bounds_by_axis = None
             self._current_position = self._deck_from_smoothie(smoothie_pos)
+        if mount is self._last_moved_mount:
+            self._last_moved_mount = None
 
     def _critical_point_for(
             self, mount: top_types.Mount,
@@ -736,7 +878,7 @@ class API(HardwareAPILike):
             # implicitly accept this as correct (by returning a null offset)
             # or not (by returning an offset calculated to move back up the
             # length of the P300 single).
-            return top_types.Point(0, 0, 0)
+            return _ZERO_POINT
 
     # Gantry/frame (i.e. not pipette) config API
     @property
@@ -763,6 +905,35 @@ class API(HardwareAPILike):
         """
         self._config = self._config._replace(**kwargs)
 
+    def _gantry_transforms(self) -> Tuple[np.ndarray, np.ndarray]:
+        """ The deck calibration transform and its inverse, which are needed
+        for every move and position update.
+
+        They are only recomputed when the config's gantry calibration is
+        replaced.
+        """
+        cal = self._config.gantry_calibration
+        if cal is not self._gantry_cal_source:
+            self._gantry_fwd = np.asarray(cal, dtype=np.float64)
+            self._gantry_inv = np.linalg.inv(self._gantry_fwd)
+            self._gantry_cal_source = cal
+        return self._gantry_fwd, self._gantry_inv
+
+    def _mount_offset(self, mount: top_types.Mount) -> top_types.Point:
+        """ The offset of `mount` from the right mount, which is where the
+        gantry position is measured.
+
+        The points are only rebuilt when the config's mount offset is
+        replaced.
+        """
+        source = self._config.mount_offset
+        if source is not self._mount_offset_source:
+            self._mount_offsets = {
+                top_types.Mount.LEFT: top_types.Point(*source),
+                top_types.Mount.RIGHT: _ZERO_POINT}
+            self._mount_offset_source = source
+        return self._mount_offsets[mount]
+
     async def update_deck_calibration(self, new_transform):
         pass
 
@@ -818,6 +989,8 @@ class API(HardwareAPILike):
             raise
         else:
             this_pipette.add_current_volume(asp_vol)
+        finally:
+            self._attached_instruments_cache = None
 
     @_log_call
     async def dispense(self, mount: top_types.Mount, volume: float = None,
@@ -864,6 +1037,8 @@ class API(HardwareAPILike):
             raise
         else:
             this_pipette.remove_current_volume(disp_vol)
+        finally:
+            self._attached_instruments_cache = None
 
     def _plunger_position(self, instr: Pipette, ul: float,
                           action: str) -> float:
@@ -892,6 +1067,7 @@ class API(HardwareAPILike):
             raise
         finally:
             this_pipette.set_current_volume(0)
+            self._attached_instruments_cache = None
 
     @_log_call
     async def pick_up_tip(self,
@@ -916,19 +1092,20 @@ class API(HardwareAPILike):
 
         # Press the nozzle into the tip <presses> number of times,
         # moving further by <increment> mm after each press
+        pick_up_current = instr.config.pick_up_current
+        pick_up_distance = instr.config.pick_up_distance
         for i in range(presses):
+            dist = -pick_up_distance - increment * i
             # move nozzle down into the tip
             with self._backend.save_current():
-                self._backend.set_active_current(instr_ax,
-                                                 instr.config.pick_up_current)
-                dist = -1 * instr.config.pick_up_distance + -1 * increment * i
-                target_pos = top_types.Point(0, 0, dist)
-                await self.move_rel(mount, target_pos, PICK_UP_SPEED)
+                self._backend.set_active_current(instr_ax, pick_up_current)
+                await self.move_rel(
+                    mount, top_types.Point(0, 0, dist), PICK_UP_SPEED)
             # move nozzle back up
-            backup_pos = top_types.Point(0, 0, -dist)
-            await self.move_rel(mount, backup_pos)
+            await self.move_rel(mount, top_types.Point(0, 0, -dist))
         instr.add_tip(tip_length=tip_length)
         instr.set_current_volume(0)
+        self._attached_instruments_cache = None
 
         # neighboring tips tend to get stuck in the space between
         # the volume chamber and the drop-tip sleeve on p1000.
@@ -969,11 +1146,13 @@ class API(HardwareAPILike):
                                          instr.config.plunger_current)
         instr.set_current_volume(0)
         instr.remove_tip()
+        self._attached_instruments_cache = None
         if home_after:
             safety_margin = abs(bottom-droptip)
-            async with self._motion_lock:
+            with self._motion_lock:
                 smoothie_pos = self._backend.fast_home(
-                    plunger_ax.name.upper(), safety_margin)
+                    plunger_ax.name, safety_margin)
+                self._bounds_by_axis = None
                 self._current_position = self._deck_from_smoothie(smoothie_pos)
             await self._move_plunger(mount, safety_margin)
 
@@ -984,12 +1163,15 @@ class API(HardwareAPILike):
         # then second, raise the pipette so loosened tips have room to fall
         shake_off_dist = SHAKE_OFF_TIPS_DISTANCE
         # TODO: ensure the distance is not >25% the diameter of placeable
-        shake_pos = top_types.Point(-shake_off_dist, 0, 0)  # move left
-        await self.move_rel(mount, shake_pos, speed=SHAKE_OFF_TIPS_SPEED)
-        shake_pos = top_types.Point(2*shake_off_dist, 0, 0)    # move right
-        await self.move_rel(mount, shake_pos, speed=SHAKE_OFF_TIPS_SPEED)
-        shake_pos = top_types.Point(-shake_off_dist, 0, 0)  # original position
-        await self.move_rel(mount, shake_pos, speed=SHAKE_OFF_TIPS_SPEED)
+        # The shake (left, right, and back to the original position) is sent
+        # as one path so it runs without stopping between segments
+        here = await self.gantry_position(
+            mount, critical_point=CriticalPoint.MOUNT)
+        shake = [here._replace(x=here.x - shake_off_dist),
+                 here._replace(x=here.x + shake_off_dist),
+                 here]
+        await self.move_path(mount, shake, speed=SHAKE_OFF_TIPS_SPEED,
+                             critical_point=CriticalPoint.MOUNT)
         # raise the pipette upwards so we are sure tip has fallen off
         up_pos = top_types.Point(0, 0, DROP_TIP_RELEASE_DISTANCE)
         await self.move_rel(mount, up_pos)
@@ -1016,15 +1198,14 @@ class API(HardwareAPILike):
             raise top_types.PipetteNotAttachedError(
                 "No pipette attached to {} mount".format(mount.name))
 
-        pos_dict: Dict = instr.config.plunger_positions
-        if top is not None:
-            pos_dict['top'] = top
-        if bottom is not None:
-            pos_dict['bottom'] = bottom
-        if blow_out is not None:
-            pos_dict['blow_out'] = blow_out
-        if bottom is not None:
-            pos_dict['drop_tip'] = drop_tip
+        updates = {name: val
+                   for name, val in (('top', top), ('bottom', bottom),
+                                     ('blow_out', blow_out),
+                                     ('drop_tip', drop_tip))
+                   if val is not None}
+        if not updates:
+            return
+        pos_dict: Dict = {**instr.config.plunger_positions, **updates}
         instr.update_config_item('plunger_positions', pos_dict)
 
     @_log_call
@@ -1033,25 +1214,26 @@ class API(HardwareAPILike):
         if not this_pipette:
             raise top_types.PipetteNotAttachedError(
                 "No pipette attached to {} mount".format(mount))
+        updates = {}
         if aspirate:
-            this_pipette.update_config_item('aspirate_flow_rate', aspirate)
+            updates['aspirate_flow_rate'] = aspirate
         if dispense:
-            this_pipette.update_config_item('dispense_flow_rate', dispense)
+            updates['dispense_flow_rate'] = dispense
+        if updates:
+            this_pipette.update_config_items(**updates)
+        self._attached_instruments_cache = None
 
     @_log_call
     async def discover_modules(self):
-        discovered = {port + model: (port, model)
-                      for port, model in self._backend.get_attached_modules()}
-        these = set(discovered.keys())
+        these = set(self._backend.get_attached_modules())
         known = set(self._attached_modules.keys())
         new = these - known
         gone = known - these
         for mod in gone:
             self._attached_modules.pop(mod)
-        for mod in new:
-            self._attached_modules[mod]\
-                = self._backend.build_module(discovered[mod][0],
-                                             discovered[mod][1])
+        for port, model in new:
+            self._attached_modules[(port, model)]\
+                = self._backend.build_module(port, model)
         return list(self._attached_modules.values())
 
     @_log_call
@@ -1064,15 +1246,14 @@ class API(HardwareAPILike):
         Returns (ok, message) where ok is True if the update succeeded and
         message is a human readable message.
         """
-        details = (module.port, module.name())
-        mod = self._attached_modules.pop(details[0] + details[1])
+        mod = self._attached_modules.pop((module.port, module.name()))
         try:
             new_mod = await self._backend.update_module(
                 mod, firmware_file, loop)
         except modules.UpdateError as e:
             return False, e.msg
         else:
-            new_details = new_mod.port + new_mod.device_info['model']
+            new_details = (new_mod.port, new_mod.device_info['model'])
             self._attached_modules[new_details] = new_mod
             return True, 'firmware update successful'
 
@@ -1091,31 +1272,34 @@ class API(HardwareAPILike):
         """
         # Clear the old offset during calibration
         pip.update_instrument_offset(top_types.Point())
+        tp = self._config.tip_probe
         # Hotspots based on our expectation of tip length and config
         hotspots = robot_configs.calculate_tip_probe_hotspots(
-            pip.current_tip_length, self._config.tip_probe)
-        new_pos: Dict[Axis, List[float]] = {
-            ax: [] for ax in Axis.gantry_axes() if ax != Axis.A}
-        safe_z = self._config.tip_probe.z_clearance.crossover + \
-            self._config.tip_probe.center[2]
+            pip.current_tip_length, tp)
+        # Running sums and counts of the measurements along x, y and z,
+        # indexed by axis value
+        sums = np.zeros(3)
+        counts = np.zeros(3, dtype=int)
+        # The probe center starts at the configured position; each axis is
+        # replaced by the measured midpoint once both sides are probed
+        overridden_center = list(tp.center)
+        safe_z = tp.z_clearance.crossover + tp.center[2]
+        bounce_d = tp.bounce_distance
+        # Each hotspot ends back up at safe_z, so only the first one needs
+        # to lift before crossing over to its start point
+        at_safe_z = False
         for hs in hotspots:
-            ax_en = Axis[hs.axis.upper()]
-            overridden_center = {
-                ax: sum(vals)/len(vals)
-                if len(vals) == 2
-                else self._config.tip_probe.center[ax.value]
-                for ax, vals in new_pos.items()
-            }
-            x0 = overridden_center[Axis.X] + hs.x_start_offs
-            y0 = overridden_center[Axis.Y] + hs.y_start_offs
+            ax_en = _AXIS_BY_NAME[hs.axis.upper()]
+            x0 = overridden_center[0] + hs.x_start_offs
+            y0 = overridden_center[1] + hs.y_start_offs
             z0 = hs.z_start_abs
-            pos = await self.current_position(mount)
-
             # Move safely to the setup point for the probe
-            await self.move_to(mount,
-                               top_types.Point(pos[Axis.X],
-                                               pos[Axis.Y],
-                                               safe_z))
+            if not at_safe_z:
+                pos = await self.current_position(mount)
+                await self.move_to(mount,
+                                   top_types.Point(pos[Axis.X],
+                                                   pos[Axis.Y],
+                                                   safe_z))
             await self.move_to(mount,
                                top_types.Point(x0, y0, safe_z))
             await self.move_to(mount,
@@ -1125,31 +1309,34 @@ class API(HardwareAPILike):
             else:
                 to_probe = ax_en
             # Probe and retrieve the position afterwards
-            async with self._motion_lock:
+            with self._motion_lock:
                 self._current_position = self._deck_from_smoothie(
                     self._backend.probe(
                         to_probe.name.lower(), hs.probe_distance))
             xyz = await self.gantry_position(mount)
+            idx = ax_en.value
             # Store the upated position.
             self._log.debug(
-                "tip probe: hs {}: start: ({} {} {}) status {} will add {}"
-                .format(hs, x0, y0, z0, new_pos, xyz[ax_en.value]))
-            new_pos[ax_en].append(xyz[ax_en.value])
+                "tip probe: hs {}: start: ({} {} {}) sums {} counts {} "
+                "will add {}"
+                .format(hs, x0, y0, z0, sums, counts, xyz[idx]))
+            sums[idx] += xyz[idx]
+            counts[idx] += 1
+            if counts[idx] == 2:
+                overridden_center[idx] = float(sums[idx]) / 2
             # Before moving up, move back to clear the switches
-            bounce = self._config.tip_probe.bounce_distance\
-                * (-1.0 if hs.probe_distance > 0 else 1.0)
-            await self.move_rel(mount,
-                                top_types.Point(
-                                    **{hs.axis: bounce}))
+            bounce = bounce_d * (-1.0 if hs.probe_distance > 0 else 1.0)
+            await self.move_rel(mount, _AXIS_UNIT[hs.axis] * bounce)
             await self.move_to(mount, xyz._replace(z=safe_z))
+            at_safe_z = True
 
-        to_ret = top_types.Point(**{ax.name.lower(): sum(vals)/len(vals)
-                                    for ax, vals in new_pos.items()})
+        to_ret = top_types.Point(*(sums / counts).tolist())
         self._log.info("Tip probe complete with {} {} on {}. "
-                       "New position: {} (default {}), averaged from {}"
+                       "New position: {} (default {}), averaged from {} "
+                       "measurements"
                        .format(pip.name, pip.pipette_id, mount.name,
-                               to_ret, self._config.tip_probe.center,
-                               new_pos))
+                               to_ret, tp.center,
+                               counts.tolist()))
         return to_ret
 
     @_log_call
@@ -1186,6 +1373,7 @@ class API(HardwareAPILike):
 
         if pip.has_tip and tip_length:
             pip.remove_tip()
+            self._attached_instruments_cache = None
 
         if not tip_length:
             assert pip.has_tip,\
@@ -1208,6 +1396,7 @@ class API(HardwareAPILike):
                 pip.remove_tip()
                 if old_tip:
                     pip.add_tip(old_tip)
+                self._attached_instruments_cache = None
 
         with _assure_tip():
             return await self._do_tp(pip, mount)
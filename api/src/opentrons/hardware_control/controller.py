@@ -92,6 +92,12 @@ class Controller:
             self._smoothie_driver.move(
                 target_position, home_flagged_axes=home_flagged_axes)
 
+    def move_path(self, target_positions: List[Dict[str, float]],
+                  home_flagged_axes: bool = True, speed: float = None):
+        with self._set_temp_speed(speed):
+            self._smoothie_driver.move_path(
+                target_positions, home_flagged_axes=home_flagged_axes)
+
     def home(self, axes: List[str] = None) -> Dict[str, float]:
         if axes:
             args: Tuple[Any, ...] = (''.join(axes),)
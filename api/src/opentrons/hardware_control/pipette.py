@@ -46,6 +46,11 @@ class Pipette:
         self._log.info("updated config: {}={}".format(elem_name, elem_val))
         self._config = self._config._replace(**{elem_name: elem_val})
 
+    def update_config_items(self, **elems: Any):
+        """ Update several config items with a single replacement """
+        self._log.info("updated config: {}".format(elems))
+        self._config = self._config._replace(**elems)
+
     @property
     def name(self) -> str:
         return self._name
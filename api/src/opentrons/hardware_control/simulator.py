@@ -1,8 +1,9 @@
 import asyncio
-import copy
+import bisect
+import functools
 import logging
-from threading import Event
-from typing import Dict, Optional, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Optional, List, Mapping, Tuple
 from contextlib import contextmanager
 from opentrons import types
 from opentrons.config.pipette_config import configs
@@ -12,19 +13,35 @@ from . import modules
 MODULE_LOG = logging.getLogger(__name__)
 
 
+_SORTED_CONFIGS = sorted(configs)
+
+
+@functools.lru_cache(maxsize=None)
 def find_config(prefix: str) -> str:
-    """ Find the most recent config matching `prefix` """
-    matches = [conf for conf in configs if conf.startswith(prefix)]
-    if not matches:
+    """ Find the most recent config matching `prefix`
+
+    The set of configs is fixed at import, so the results are cached.
+    """
+    # Everything starting with prefix sorts together, at or after prefix
+    # itself, so the first candidate is either an exact match or the
+    # lexically-first one
+    idx = bisect.bisect_left(_SORTED_CONFIGS, prefix)
+    if idx == len(_SORTED_CONFIGS)\
+            or not _SORTED_CONFIGS[idx].startswith(prefix):
         raise KeyError('No match found for prefix {}'.format(prefix))
-    if prefix in matches:
-        return prefix
-    else:
-        return sorted(matches)[0]
+    return _SORTED_CONFIGS[idx]
 
 
 _HOME_POSITION = {'X': 418.0, 'Y': 353.0, 'Z': 218.0,
                   'A': 218.0, 'B': 19.0, 'C': 19.0}
+# Shared by every empty mount; callers only read the result, as they do
+# the instrument dicts passed to the constructor
+_NO_INSTRUMENT: Dict[str, Optional[str]] = {'model': None, 'id': None}
+_ALL_ENGAGED = dict.fromkeys(_HOME_POSITION, True)
+# Read-only, since every simulator hands out the same bounds
+_AXIS_BOUNDS: Mapping[str, Tuple[float, float]] = MappingProxyType(
+    {ax: (0, pos+0.5) for ax, pos in _HOME_POSITION.items()
+     if ax not in ('B', 'C')})
 
 
 class Simulator:
@@ -75,36 +92,43 @@ class Simulator:
         self._config = config
         self._loop = loop
         self._attached_instruments = attached_instruments
-        self._attached_modules = [('mod' + str(idx), mod)
-                                  for idx, mod
-                                  in enumerate(attached_modules)]
-        self._position = copy.copy(_HOME_POSITION)
+        self._attached_modules = [(f'mod{idx}', mod)
+                                  for idx, mod in enumerate(attached_modules)]
+        self._position = _HOME_POSITION.copy()
         # Engaged axes start all true in smoothie for some reason so we
         # imitate that here
-        self._engaged_axes = {ax: True for ax in _HOME_POSITION}
+        self._engaged_axes = _ALL_ENGAGED.copy()
         self._lights = {'button': False, 'rails': False}
-        self._run_flag = Event()
+        # Only ever checked, never waited on, so a plain flag is enough
+        self._run_flag = False
         self._log = MODULE_LOG.getChild(repr(self))
         self._strict_attached = bool(strict_attached_instruments)
 
     def move(self, target_position: Dict[str, float],
              home_flagged_axes: bool = True, speed: float = None):
-        if self._run_flag.is_set():
+        if self._run_flag:
             self._log.warning("Move to {} would be blocked by pause"
                               .format(target_position))
         self._position.update(target_position)
-        self._engaged_axes.update({ax: True
-                                   for ax in target_position})
+        for ax in target_position:
+            self._engaged_axes[ax] = True
+
+    def move_path(self, target_positions: List[Dict[str, float]],
+                  home_flagged_axes: bool = True, speed: float = None):
+        for target_position in target_positions:
+            self.move(target_position, home_flagged_axes, speed)
 
     def home(self, axes: List[str] = None) -> Dict[str, float]:
-        if self._run_flag.is_set():
+        if self._run_flag:
             self._log.warning("Home would be blocked by pause")
         # driver_3_0-> HOMED_POSITION
-        checked_axes = axes or 'XYZABC'
-        self._position.update({ax: _HOME_POSITION[ax]
-                               for ax in checked_axes})
-        self._engaged_axes.update({ax: True
-                                   for ax in checked_axes})
+        if not axes:
+            self._position.update(_HOME_POSITION)
+            self._engaged_axes.update(_ALL_ENGAGED)
+        else:
+            for ax in axes:
+                self._position[ax] = _HOME_POSITION[ax]
+                self._engaged_axes[ax] = True
         return self._position
 
     def fast_home(self, axis: str, margin: float) -> Dict[str, float]:
@@ -138,24 +162,22 @@ class Simulator:
             expected_instr = expected.get(mount, None)
             init_instr = self._attached_instruments.get(mount, {})
             found_model = init_instr.get('model', '')
-            if expected_instr and found_model\
-                    and not found_model.startswith(expected_instr):
-                if self._strict_attached:
-                    raise RuntimeError(
-                        'mount {}: expected instrument {} but got {}'
-                        .format(mount.name, expected_instr, init_instr))
-                else:
+            if found_model:
+                if expected_instr\
+                        and not found_model.startswith(expected_instr):
+                    if self._strict_attached:
+                        raise RuntimeError(
+                            'mount {}: expected instrument {} but got {}'
+                            .format(mount.name, expected_instr, init_instr))
                     to_return[mount] = {
                         'model': find_config(expected_instr),
                         'id': None}
-            elif found_model and expected_instr:
-                # Instrument detected matches instrument expected (note:
-                # "instrument detected" means passed as an argument to the
-                # constructor of this class)
-                to_return[mount] = init_instr
-            elif found_model:
-                # Instrument detected and no expected instrument specified
-                to_return[mount] = init_instr
+                else:
+                    # Instrument detected (note: "instrument detected" means
+                    # passed as an argument to the constructor of this class)
+                    # and either matching the expected instrument or with no
+                    # expected instrument specified
+                    to_return[mount] = init_instr
             elif expected_instr:
                 # Expected instrument specified and no instrument detected
                 to_return[mount] = {
@@ -163,9 +185,7 @@ class Simulator:
                     'id': None}
             else:
                 # No instrument detected or expected
-                to_return[mount] = {
-                    'model': None,
-                    'id': None}
+                to_return[mount] = _NO_INSTRUMENT
         return to_return
 
     def set_active_current(self, axis, amp):
@@ -189,10 +209,9 @@ class Simulator:
         return module
 
     @property
-    def axis_bounds(self) -> Dict[str, Tuple[float, float]]:
+    def axis_bounds(self) -> Mapping[str, Tuple[float, float]]:
         """ The (minimum, maximum) bounds for each axis. """
-        return {ax: (0, pos+0.5) for ax, pos in _HOME_POSITION.items()
-                if ax not in 'BC'}
+        return _AXIS_BOUNDS
 
     @property
     def fw_version(self) -> Optional[str]:
@@ -208,7 +227,8 @@ class Simulator:
         return self._engaged_axes
 
     def disengage_axes(self, axes: List[str]):
-        self._engaged_axes.update({ax: False for ax in axes})
+        for ax in axes:
+            self._engaged_axes[ax] = False
 
     def set_lights(self, button: Optional[bool], rails: Optional[bool]):
         if button is not None:
@@ -223,13 +243,13 @@ class Simulator:
         pass
 
     def pause(self):
-        self._run_flag.clear()
+        self._run_flag = False
 
     def resume(self):
-        self._run_flag.set()
+        self._run_flag = True
 
     def halt(self):
-        self._run_flag.set()
+        self._run_flag = True
 
     def probe(self, axis: str, distance: float) -> Dict[str, float]:
         self._position[axis.upper()] = self._position[axis.upper()] + distance
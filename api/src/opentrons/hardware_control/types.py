@@ -14,9 +14,7 @@ class Axis(enum.Enum):
 
     @classmethod
     def by_mount(cls, mount: opentrons.types.Mount):
-        bm = {opentrons.types.Mount.LEFT: cls.Z,
-              opentrons.types.Mount.RIGHT: cls.A}
-        return bm[mount]
+        return _Z_BY_MOUNT[mount]
 
     @classmethod
     def gantry_axes(cls) -> Tuple['Axis', 'Axis', 'Axis', 'Axis']:
@@ -27,14 +25,20 @@ class Axis(enum.Enum):
 
     @classmethod
     def of_plunger(cls, mount: opentrons.types.Mount):
-        pm = {opentrons.types.Mount.LEFT: cls.B,
-              opentrons.types.Mount.RIGHT: cls.C}
-        return pm[mount]
+        return _PLUNGER_BY_MOUNT[mount]
 
     def __str__(self):
         return self.name
 
 
+# Built once rather than on every by_mount/of_plunger call, since those are
+# made for nearly every motion
+_Z_BY_MOUNT = {opentrons.types.Mount.LEFT: Axis.Z,
+               opentrons.types.Mount.RIGHT: Axis.A}
+_PLUNGER_BY_MOUNT = {opentrons.types.Mount.LEFT: Axis.B,
+                     opentrons.types.Mount.RIGHT: Axis.C}
+
+
 class HardwareAPILike:
     """ A dummy class useful in isinstance checks to accept an API or adapter
     """
@@ -4,8 +4,10 @@ This should not be imported directly; it is used to provide backwards
 compatible singletons in opentrons/__init__.py.
 """
 
-import importlib.util
-from typing import Any, List
+import inspect
+import sys
+from types import ModuleType
+from typing import Any, List, Set, Tuple
 
 import opentrons.hardware_control as hc
 from opentrons.config.pipette_config import configs
@@ -15,6 +17,8 @@ from .contexts import ProtocolContext, InstrumentContext
 
 
 def run(protocol_bytes: bytes, context: ProtocolContext):
+    # Only needed here, so not imported by everything that imports the shims
+    import importlib.util
     source = importlib.util.decode_source(protocol_bytes)
     exec(source)
 
@@ -67,102 +71,122 @@ class BCRobot:
 
     def __getattr__(self, name):
         """ Provide transparent access to the protocol context """
-        return getattr(self._ctx, name)
+        attr = getattr(self._ctx, name)
+        if inspect.ismethod(attr) and attr.__self__ is self._ctx:
+            # Later lookups of the context's methods then find them on this
+            # object directly; anything else (e.g. properties) can change,
+            # so it is looked up every time
+            self.__dict__[name] = attr
+        return attr
+
+
+def _instr_ctor_names() -> List[Tuple[str, str]]:
+    """ Pair each versionless pipette model with the name of its initializer
+    (e.g. ``('p10_single', 'P10_Single')``), once per model.
+    """
+    names: List[Tuple[str, str]] = []
+    seen: Set[str] = set()
+    for config in configs:
+        # Split the long name with the version
+        comps = config.split('_')
+        # To get the name without the version
+        generic_model = '_'.join(comps[:2])
+        number = comps[0].upper()
+        ptype_0 = comps[1][0].upper()
+        # And a nicely formatted version to name the function
+        ptype = ptype_0 + comps[1][1:]
+        proper_name = number + '_' + ptype
+        if proper_name in seen:
+            # Only build one initializer function for each versionless
+            # model (i.e. don’t make a P10_Single for both p10_single_v1
+            # and p10_single_v1.3)
+            continue
+        seen.add(proper_name)
+        names.append((generic_model, proper_name))
+    return names
+
+
+_INSTR_CTOR_NAMES = _instr_ctor_names()
+
+
+def _build_initializer(model, proper_name, owner):
+    """ Build an initializer function for a given pipette.
+
+    This is a separate function so that the `proper_name` is correctly
+    caught in the closure that it returns.
+    """
+    def initializer(
+            self,
+            mount: str,
+            trash_container: Labware = None,
+            tip_racks: List[Labware] = None,
+            aspirate_flow_rate: float = None,
+            dispense_flow_rate: float = None,
+            min_volume: float = None,
+            max_volume: float = None) -> InstrumentContext:
+        return _load_instr(self._ctx, model, mount)
+    initializer.__name__ = proper_name
+    initializer.__qualname__ = '.'.join([owner, proper_name])
+    initializer.__doc__ = \
+        """Build a {} in a backwards-compatible way.
+
+        :param mount: The mount to load the instrument. One of
+                      `'left'` or `'right'`.
+        :param trash_container: If specified, a :py:class:`.Labware` to
+                                use for trash.
+        :param tip_racks: If specified, a list of :py:class:`.Labware`
+                          containing tips.
+        :param aspirate_flow_rate: If specified, a flow rate (in uL/s)
+                                   to use when aspirating. By default,
+                                   the value from the pipette's
+                                   configuration.
+        :param dispense_flow_rate: If specified, a flow rate (in uL/s)
+                                   to use when dispensing. By default,
+                                   the value from the pipette's
+                                   configuration.
+        :param min_volume: The minimum volume that can be aspirated at
+                           once. By default, the pipette's minimum
+                           volume.
+        :param max_volume: The maximum volume that can be aspirated at
+                           once. By default, the pipette's maximum
+                           volume.
+
+        :returns: An :py:class:`.InstrumentContext`, which represents
+                  the newly-loaded pipette.
+        """.format(' '.join(proper_name.split('_')))
+    return initializer
+
+
+def _load_instr(ctx,
+                name: str,
+                mount: str,
+                *args, **kwargs) -> InstrumentContext:
+    """ Build an instrument in a backwards-compatible way.
 
+    You should almost certainly not be calling this function from a
+    protocol; if you want to create a pipette on a lower level, use
+    :py:meth:`.ProtocolContext.load_instrument` directly, and if you
+    want to create an instrument easily use one of the partials below.
+    """
+    return ctx.load_instrument(name, Mount[mount.upper()])
 
-class AddInstrumentCtors(type):
 
-    @staticmethod
-    def _build_initializer(model, proper_name):
-        """ Build an initializer function for a given pipette.
+def _add_instrument_ctors(cls):
+    """ Add the pipette initializer functions to the class. """
+    for generic_model, proper_name in _INSTR_CTOR_NAMES:
+        if hasattr(cls, proper_name):
+            # Don't replace anything the class already defines
+            continue
 
-        This is a separate function so that the `proper_name` is correctly
-        caught in the closure that it returns.
-        """
-        def initializer(
-                self,
-                mount: str,
-                trash_container: Labware = None,
-                tip_racks: List[Labware] = None,
-                aspirate_flow_rate: float = None,
-                dispense_flow_rate: float = None,
-                min_volume: float = None,
-                max_volume: float = None) -> InstrumentContext:
-            return AddInstrumentCtors._load_instr(self._ctx,
-                                                  model,
-                                                  mount)
-        initializer.__name__ = proper_name
-        initializer.__qualname__ = '.'.join([AddInstrumentCtors.__qualname__,
-                                             proper_name])
-        initializer.__doc__ = \
-            """Build a {} in a backwards-compatible way.
-
-            :param mount: The mount to load the instrument. One of
-                          `'left'` or `'right'`.
-            :param trash_container: If specified, a :py:class:`.Labware` to
-                                    use for trash.
-            :param tip_racks: If specified, a list of :py:class:`.Labware`
-                              containing tips.
-            :param aspirate_flow_rate: If specified, a flow rate (in uL/s)
-                                       to use when aspirating. By default,
-                                       the value from the pipette's
-                                       configuration.
-            :param dispense_flow_rate: If specified, a flow rate (in uL/s)
-                                       to use when dispensing. By default,
-                                       the value from the pipette's
-                                       configuration.
-            :param min_volume: The minimum volume that can be aspirated at
-                               once. By default, the pipette's minimum
-                               volume.
-            :param max_volume: The maximum volume that can be aspirated at
-                               once. By default, the pipette's maximum
-                               volume.
-
-            :returns: An :py:class:`.InstrumentContext`, which represents
-                      the newly-loaded pipette.
-            """.format(' '.join(proper_name.split('_')))
-        return initializer
-
-    @staticmethod
-    def _load_instr(ctx,
-                    name: str,
-                    mount: str,
-                    *args, **kwargs) -> InstrumentContext:
-        """ Build an instrument in a backwards-compatible way.
-
-        You should almost certainly not be calling this function from a
-        protocol; if you want to create a pipette on a lower level, use
-        :py:meth:`.ProtocolContext.load_instrument` directly, and if you
-        want to create an instrument easily use one of the partials below.
-        """
-        return ctx.load_instrument(name, Mount[mount.upper()])
-
-    def __new__(cls, name, bases, namespace, **kwds):
-        """ Add the pipette initializer functions to the class. """
-        res = type.__new__(cls, name, bases, namespace)
-        for config in configs:
-            # Split the long name with the version
-            comps = config.split('_')
-            # To get the name without the version
-            generic_model = '_'.join(comps[:2])
-            number = comps[0].upper()
-            ptype_0 = comps[1][0].upper()
-            # And a nicely formatted version to name the function
-            ptype = ptype_0 + comps[1][1:]
-            proper_name = number + '_' + ptype
-            if hasattr(res, proper_name):
-                # Only build one initializer function for each versionless
-                # model (i.e. don’t make a P10_Single for both p10_single_v1
-                # and p10_single_v1.3)
-                continue
-
-            initializer = cls._build_initializer(generic_model, proper_name)
-            setattr(res, proper_name, initializer)
-
-        return res
-
-
-class BCInstruments(metaclass=AddInstrumentCtors):
+        initializer = _build_initializer(
+            generic_model, proper_name, cls.__qualname__)
+        setattr(cls, proper_name, initializer)
+
+    return cls
+
+
+@_add_instrument_ctors
+class BCInstruments:
     """ A backwards-compatibility shim for the `New Protocol API`_.
 
     This class is provides a replacement for the `opentrons.instrument`
@@ -172,6 +196,8 @@ class BCInstruments(metaclass=AddInstrumentCtors):
     of :py:class:`.ProtocolContext`. For information on how to replace calls to
     methods of this class, see the method documentation.
     """
+    __slots__ = ('_ctx',)
+
     def __init__(self, ctx: ProtocolContext) -> None:
         self._ctx = ctx
 
@@ -187,23 +213,23 @@ class BCLabware:
     :py:class:`.ProtocolContext`. For information on how to replace calls to
     methods of this class, see the method documentation.
     """
+    __slots__ = ('_ctx',)
+
     def __init__(self, ctx: ProtocolContext) -> None:
         self._ctx = ctx
 
-    LW_NO_EQUIVALENT = {'24-vial-plate', '48-vial-plate', '5ml-3x4',
-                        '96-PCR-tall', '96-deep-well', '96-well-plate-20mm',
-                        'MALDI-plate', 'PCR-strip-tall', 'T25-flask',
-                        'T75-flask', 'alum-block-pcr-strips', 'e-gelgol',
-                        'hampton-1ml-deep-block', 'point',
-                        'opentrons-aluminum-block-PCR-strips-200ul',
-                        'rigaku-compact-crystallization-plate',
-                        'small_vial_rack_16x45', 'temperature-plate',
-                        'tiprack-10ul-H', 'tiprack-200ul',
-                        'trough-12row-short', 'trough-1row-25ml',
-                        'trough-1row-test', 'tube-rack-.75ml',
-                        'tube-rack-2ml-9x9', 'tube-rack-5ml-96',
-                        'tube-rack-80well', 'wheaton_vial_rack',
-                        'tube-rack-15_50ml', 'tube-rack-2ml'}
+    LW_NO_EQUIVALENT = frozenset((
+        '24-vial-plate', '48-vial-plate', '5ml-3x4', '96-PCR-tall',
+        '96-deep-well', '96-well-plate-20mm', 'MALDI-plate', 'PCR-strip-tall',
+        'T25-flask', 'T75-flask', 'alum-block-pcr-strips', 'e-gelgol',
+        'hampton-1ml-deep-block', 'point',
+        'opentrons-aluminum-block-PCR-strips-200ul',
+        'rigaku-compact-crystallization-plate', 'small_vial_rack_16x45',
+        'temperature-plate', 'tiprack-10ul-H', 'tiprack-200ul',
+        'trough-12row-short', 'trough-1row-25ml', 'trough-1row-test',
+        'tube-rack-.75ml', 'tube-rack-2ml-9x9', 'tube-rack-5ml-96',
+        'tube-rack-80well', 'wheaton_vial_rack', 'tube-rack-15_50ml',
+        'tube-rack-2ml'))
     """ Labwares that are no longer supported in this version """
 
     LW_TRANSLATION = {
@@ -231,6 +257,14 @@ class BCLabware:
     }
     """ A table mapping old labware names to new labware names"""
 
+    _LOAD_ERRORS = {
+        **{lw: 'Labware {} is not supported'.format(lw)
+           for lw in LW_NO_EQUIVALENT},
+        'magdeck': 'Module load not yet implemented',
+        'tempdeck': 'Module load not yet implemented'}
+    """ Why each name from :py:attr:`LW_NO_EQUIVALENT` (or a module name)
+    cannot be loaded """
+
     def load(self, container_name, slot, label=None, share=False):
         """ Load a piece of labware by specifying its name and position.
 
@@ -245,16 +279,10 @@ class BCLabware:
         if share:
             raise NotImplementedError("Sharing not supported")
 
-        try:
-            name = self.LW_TRANSLATION[container_name]
-        except KeyError:
-            if container_name in self.LW_NO_EQUIVALENT:
-                raise NotImplementedError("Labware {} is not supported"
-                                          .format(container_name))
-            elif container_name in ('magdeck', 'tempdeck'):
-                raise NotImplementedError("Module load not yet implemented")
-            else:
-                name = container_name
+        error = self._LOAD_ERRORS.get(container_name)
+        if error:
+            raise NotImplementedError(error)
+        name = self.LW_TRANSLATION.get(container_name, container_name)
 
         return self._ctx.load_labware_by_name(name, slot, label)
 
@@ -266,6 +294,8 @@ class BCLabware:
 
 
 class BCModules:
+    __slots__ = ('_ctx',)
+
     def __init__(self, ctx: ProtocolContext) -> None:
         self._ctx = ctx
 
@@ -304,10 +334,29 @@ def reset_globals(hardware=None, loop=None):
 
 
 def reset():
-    global robot
+    if 'robot' not in globals():
+        reset_globals()
     robot.reset()
 
 
-robot, instruments, containers, labware, modules = build_globals()
+_LAZY_GLOBALS = frozenset(('robot', 'instruments', 'containers', 'labware',
+                           'modules'))
+
+
+class _BackCompatModule(ModuleType):
+    """ Build the singletons on first access rather than at import.
+
+    Building them makes a hardware simulator and a protocol context (with
+    its own thread), which most importers of this module never use.
+    """
+    def __getattr__(self, name):
+        if name in _LAZY_GLOBALS:
+            reset_globals()
+            return self.__dict__[name]
+        raise AttributeError("module '{}' has no attribute '{}'"
+                             .format(self.__name__, name))
+
+
+sys.modules[__name__].__class__ = _BackCompatModule
 
 __all__ = ['robot', 'reset', 'instruments', 'containers', 'labware', 'modules']
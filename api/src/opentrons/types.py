@@ -34,6 +34,14 @@ class Point(NamedTuple):
             return NotImplemented
         return Point(self.x - other.x, self.y - other.y, self.z - other.z)
 
+    def __mul__(self, other: Any) -> 'Point':
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        return Point(self.x * other, self.y * other, self.z * other)
+
+    def __rmul__(self, other: Any) -> 'Point':
+        return self.__mul__(other)
+
     def __str__(self):
         return '({}, {}, {})'.format(self.x, self.y, self.z)
 
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy import insert, dot
 from numpy.linalg import inv
-from typing import List, Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 
 def solve(expected: List[Tuple[float, float]],
@@ -140,3 +140,26 @@ def apply_reverse(
     """ Like apply_transform but inverts the transform first
     """
     return apply_transform(inv(t), pos)
+
+
+def apply_transform_batch(
+        t: Union[List[List[float]], np.ndarray],
+        positions: Sequence[Tuple[float, float, float]],
+        with_offsets=True) -> List[Tuple[float, float, float]]:
+    """ Like apply_transform for several points at once, transforming all
+    the points in a single dot
+    """
+    extended = 1 if with_offsets else 0
+    points = np.array([list(pos) + [extended] for pos in positions])
+    return [tuple(row[:3])  # type: ignore
+            for row in dot(points, np.transpose(t))]
+
+
+def apply_reverse_batch(
+        t: Union[List[List[float]], np.ndarray],
+        positions: Sequence[Tuple[float, float, float]],
+        with_offsets=True) -> List[Tuple[float, float, float]]:
+    """ Like apply_reverse for several points at once, inverting the
+    transform only once
+    """
+    return apply_transform_batch(inv(t), positions, with_offsets)
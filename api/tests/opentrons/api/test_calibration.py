@@ -153,10 +153,15 @@ async def test_correct_hotspots():
 async def test_move_to_front_api2(main_router, model):
     main_router.calibration_manager._hardware.home()
     with mock.patch.object(main_router.calibration_manager._hardware._api,
-                           'move_to') as patch:
+                           'move_path') as patch:
         main_router.calibration_manager.move_to_front(model.instrument)
-        patch.assert_called_with(Mount.RIGHT, Point(132.5, 90.5, 150),
-                                 critical_point=CriticalPoint.NOZZLE)
+        patch.assert_called_once()
+        mount, path = patch.call_args[0]
+        assert mount == Mount.RIGHT
+        assert path[1:] == [Point(132.5, 90.5, path[0].z),
+                            Point(132.5, 90.5, 150)]
+        assert patch.call_args[1] == {
+            'critical_point': CriticalPoint.NOZZLE}
 
         await main_router.wait_until(state('moving'))
         await main_router.wait_until(state('ready'))
@@ -227,6 +232,29 @@ async def test_home_api2(main_router, model):
     await main_router.wait_until(state('ready'))
 
 
+@pytest.mark.api2_only
+async def test_session_connects_once(main_router, model, monkeypatch):
+    manager = main_router.calibration_manager
+    ctx = model.instrument._context
+    connects = []
+    orig_temp_connect = ctx.temp_connect
+
+    def counting_temp_connect(hardware):
+        connects.append(hardware)
+        return orig_temp_connect(hardware)
+
+    monkeypatch.setattr(ctx, 'temp_connect', counting_temp_connect)
+    with mock.patch.object(model.instrument._instrument, 'home') as home:
+        manager.begin_session(model.instrument)
+        manager.home(model.instrument)
+        manager.home(model.instrument)
+        assert len(connects) == 1
+        manager.end_session()
+        manager.home(model.instrument)
+        assert len(connects) == 2
+        assert home.call_count == 3
+
+
 @pytest.mark.api1_only
 async def test_home_api1(main_router, model):
     with mock.patch.object(model.instrument._instrument, 'home') as home:
@@ -331,6 +359,22 @@ async def test_update_container_offset_v1(main_router, model):
         )
 
 
+@pytest.mark.api2_only
+async def test_well0_cached_until_recalibrated(main_router, model):
+    well = model.container.well0
+    assert well is model.container._container.wells()[0]
+    main_router.calibration_manager.home(model.instrument)
+    main_router.calibration_manager.move_to(model.instrument, model.container)
+    assert model.container.well0 is well
+
+    main_router.calibration_manager.update_container_offset(
+        model.container,
+        model.instrument
+    )
+    assert model.container.well0 is not well
+    assert model.container.well0 is model.container._container.wells()[0]
+
+
 @pytest.mark.api2_only
 async def test_jog_calibrate_bottom_v2(
         main_router,
@@ -1,7 +1,9 @@
 from math import pi, sin, cos
-from opentrons.util.linal import solve, add_z, apply_transform
+from opentrons.util.linal import (solve, add_z, apply_transform,
+                                  apply_reverse, apply_reverse_batch)
 from numpy.linalg import inv
 import numpy as np
+import pytest
 
 
 def test_solve():
@@ -68,3 +70,16 @@ def test_apply_transform():
 
     result = apply_transform(inv(transform), (x, y, z))
     assert result == expected
+
+
+def test_apply_reverse_batch():
+    transform = [
+        [1, 0.01, 0, -0.1],
+        [-0.01, 1, 0, -0.2],
+        [0, 0, 1, 0.3],
+        [0, 0, 0, 1]]
+    points = [(1, 2, 3), (10, 20, 30), (0, 0, 0)]
+    result = apply_reverse_batch(transform, points)
+    assert len(result) == len(points)
+    for batched, point in zip(result, points):
+        assert batched == pytest.approx(apply_reverse(transform, point))
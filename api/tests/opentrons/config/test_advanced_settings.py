@@ -0,0 +1,23 @@
+from opentrons.config import advanced_settings as advs
+
+
+def test_settings_file_read_once(monkeypatch):
+    reads = []
+    orig_read = advs._read_json_file
+
+    def counting_read(path):
+        reads.append(path)
+        return orig_read(path)
+
+    monkeypatch.setattr(advs, '_read_json_file', counting_read)
+    assert not advs.get_adv_setting('calibrateToBottom')
+    assert not advs.get_adv_setting('shortFixedTrash')
+    assert len(reads) == 1
+
+
+def test_set_setting_invalidates_cache():
+    assert not advs.get_adv_setting('calibrateToBottom')
+    advs.set_adv_setting('calibrateToBottom', True)
+    assert advs.get_adv_setting('calibrateToBottom') is True
+    advs.set_adv_setting('calibrateToBottom', False)
+    assert advs.get_adv_setting('calibrateToBottom') is False
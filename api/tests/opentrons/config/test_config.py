@@ -0,0 +1,125 @@
+from pathlib import Path
+
+from opentrons import config
+
+
+def test_config_loads_lazily(monkeypatch):
+    loads = []
+
+    def fake_load():
+        loads.append(True)
+        return {'log_dir': Path('logs')}
+
+    monkeypatch.setattr(config, 'load_and_migrate', fake_load)
+    lazy = config._LazyConfig()
+    assert not loads
+    assert lazy['log_dir'] == Path('logs')
+    assert dict(lazy) == {'log_dir': Path('logs')}
+    assert len(loads) == 1
+    lazy.load()
+    assert len(loads) == 2
+
+
+def test_ensure_paths_and_types(tmpdir):
+    base = Path(str(tmpdir))
+    index = config.generate_config_index({}, base)
+    result = config._ensure_paths_and_types(
+        {**index, 'not_a_config_element': 'ignored'})
+    assert list(result.keys()) == list(index.keys())
+    for ce in config.CONFIG_ELEMENTS:
+        assert isinstance(result[ce.name], Path)
+        if ce.kind == config.ConfigElementType.DIR:
+            assert result[ce.name].is_dir()
+        else:
+            assert result[ce.name].parent.is_dir()
+
+
+def test_write_and_load_config(tmpdir):
+    base = Path(str(tmpdir))
+    index = config.generate_config_index({}, base)
+    config.write_config({**index, 'not_a_config_element': 'dropped'}, base)
+    written = config._read_json(base/config._CONFIG_FILENAME)
+    assert written == {k: str(v) for k, v in index.items()}
+    assert config._load_with_overrides(base) == index
+
+
+def test_overrides_loaded_as_paths(tmpdir, monkeypatch):
+    base = Path(str(tmpdir))
+    monkeypatch.setenv('OT_API_LOG_DIR', str(base/'elsewhere'))
+    loaded = config._load_with_overrides(base)
+    assert loaded['log_dir'] == base/'elsewhere'
+    assert all(isinstance(v, Path) for v in loaded.values())
+
+
+def test_environ_overrides(monkeypatch):
+    monkeypatch.setenv('OT_API_LOG_DIR', '/tmp/somewhere')
+    monkeypatch.setenv('OT_API_NOT_A_CONFIG_ELEMENT', 'ignored')
+    assert config._get_environ_overrides() == {'log_dir': '/tmp/somewhere'}
+
+
+def test_missing_dirs(tmpdir):
+    base = Path(str(tmpdir))
+    (base/'exists').mkdir()
+    (base/'a_file').touch()
+    assert config._missing_dirs([base/'exists',
+                                 base/'a_file',
+                                 base/'new',
+                                 base/'new'/'nested']) == [
+        base/'a_file', base/'new', base/'new'/'nested']
+
+
+def test_write_config_replaces_atomically(tmpdir, monkeypatch):
+    base = Path(str(tmpdir))
+    index = config.generate_config_index({}, base)
+    config.write_config(index, base)
+
+    def broken_replace(src, dst):
+        raise OSError('power lost')
+
+    monkeypatch.setattr(config.os, 'replace', broken_replace)
+    config.write_config(
+        {**index, 'log_dir': base/'elsewhere'}, base)
+    assert config._load_with_overrides(base) == index
+    assert not (base/(config._CONFIG_FILENAME + '.tmp')).exists()
+
+
+def test_legacy_index_scanned_once(tmpdir, monkeypatch):
+    legacy = Path(str(tmpdir))/'index.json'
+    legacy.write_text('{"robotSettingsFile": "/data/robot.json"}')
+    monkeypatch.setattr(config, '_LEGACY_INDICES', (legacy,))
+    monkeypatch.setattr(config, '_LEGACY_CACHE_LOADED', False)
+    monkeypatch.setattr(config, '_legacy_index_cache', None)
+    assert config._legacy_index() == {
+        'robotSettingsFile': '/data/robot.json'}
+    legacy.write_text('{}')
+    assert config._legacy_index() == {
+        'robotSettingsFile': '/data/robot.json'}
+    config._erase_old_indices()
+    assert not legacy.exists()
+    assert config._legacy_index() is None
+
+
+def test_base_dir_cached_until_reload(tmpdir, monkeypatch):
+    first = Path(str(tmpdir))/'first'
+    second = Path(str(tmpdir))/'second'
+    monkeypatch.setenv('OT_API_CONFIG_DIR', str(first))
+    config.reload()
+    assert config.infer_config_base_dir() == first
+    monkeypatch.setenv('OT_API_CONFIG_DIR', str(second))
+    assert config.infer_config_base_dir() == first
+    config.reload()
+    assert config.infer_config_base_dir() == second
+    assert config.CONFIG['log_dir'].parent == second
+
+
+def test_migrate_path_replaces_destination(tmpdir):
+    base = Path(str(tmpdir))
+    old = base/'old'
+    old.mkdir()
+    (old/'kept').write_text('new data')
+    new = base/'new'
+    new.mkdir()
+    (new/'stale').write_text('old data')
+    config._migrate_path(old, new)
+    assert not old.exists()
+    assert sorted(p.name for p in new.iterdir()) == ['kept']
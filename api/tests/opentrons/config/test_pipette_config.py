@@ -64,6 +64,16 @@ def test_ul_per_mm_continuous(pipette_model):
         assert diff_mm < 1e-2
 
 
+def test_piecewise_volume_conversion():
+    sequence = [[10, 1, 0], [20, 2, -10], [30, 3, -30]]
+    assert pipette_config.piecewise_volume_conversion(5, sequence) == 5
+    assert pipette_config.piecewise_volume_conversion(10, sequence) == 10
+    assert pipette_config.piecewise_volume_conversion(15, sequence) == 20
+    assert pipette_config.piecewise_volume_conversion(30, sequence) == 60
+    with pytest.raises(IndexError):
+        pipette_config.piecewise_volume_conversion(31, sequence)
+
+
 def test_override_load():
     cdir = CONFIG['pipette_config_overrides_dir']
 
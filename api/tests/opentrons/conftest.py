@@ -46,9 +46,14 @@ MAIN_TESTER_DB = str(os.path.join(
 
 def state(topic, state):
     def _match(item):
+        payload = item['payload']
+        if type(payload) is dict:
+            payload_state = payload.get('state')
+        else:
+            payload_state = payload.state
         return \
             item['topic'] == topic and \
-            item['payload'].state == state
+            payload_state == state
 
     return _match
 
@@ -0,0 +1,70 @@
+from unittest import mock
+
+import pytest
+
+from opentrons.drivers.serial_communication import SerialNoResponse
+from opentrons.drivers.thermocycler import driver
+
+
+def test_write_and_return_retries(monkeypatch):
+    tc = driver.Thermocycler()
+    tc._connection = mock.Mock()
+    sleeps = []
+    monkeypatch.setattr(driver, 'sleep', sleeps.append)
+    responses = [SerialNoResponse(), SerialNoResponse(), 'T:none']
+
+    def fake_write_and_return(cmd, ack, connection, timeout):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(driver.serial_communication, 'write_and_return',
+                        fake_write_and_return)
+
+    assert tc._write_and_return('M105', 1, 3) == 'T:none'
+    assert sleeps == [driver.DEFAULT_STABILIZE_DELAY / 2,
+                      driver.DEFAULT_STABILIZE_DELAY]
+    # The port is only reopened before the last attempt
+    assert tc._connection.close.call_count == 1
+    assert tc._connection.open.call_count == 1
+
+
+def test_write_and_return_gives_up(monkeypatch):
+    tc = driver.Thermocycler()
+    tc._connection = mock.Mock()
+    monkeypatch.setattr(driver, 'sleep', lambda delay: None)
+    attempts = []
+
+    def fake_write_and_return(cmd, ack, connection, timeout):
+        attempts.append(cmd)
+        raise SerialNoResponse()
+
+    monkeypatch.setattr(driver.serial_communication, 'write_and_return',
+                        fake_write_and_return)
+
+    with pytest.raises(SerialNoResponse):
+        tc._write_and_return('M105', 1, driver.DEFAULT_COMMAND_RETRIES)
+    assert len(attempts) == driver.DEFAULT_COMMAND_RETRIES
+
+
+def test_write_and_return_always_attempts(monkeypatch):
+    tc = driver.Thermocycler()
+    tc._connection = mock.Mock()
+    monkeypatch.setattr(driver, 'sleep', lambda delay: None)
+    attempts = []
+
+    def fake_write_and_return(cmd, ack, connection, timeout):
+        attempts.append(cmd)
+        raise SerialNoResponse()
+
+    monkeypatch.setattr(driver.serial_communication, 'write_and_return',
+                        fake_write_and_return)
+
+    with pytest.raises(SerialNoResponse):
+        tc._write_and_return('M105', 1, 0)
+    assert len(attempts) == 1
+
+    monkeypatch.setattr(driver.serial_communication, 'write_and_return',
+                        lambda cmd, ack, connection, timeout: 'T:none')
+    assert tc._write_and_return('M105', 1, 0) == 'T:none'
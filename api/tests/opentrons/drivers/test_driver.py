@@ -270,6 +270,39 @@ def test_plunger_commands(smoothie, monkeypatch):
     fuzzy_assert(result=command_log, expected=expected)
 
 
+def test_move_path(smoothie, monkeypatch):
+    from opentrons.drivers import serial_communication
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    command_log = []
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    def write_with_log(command, ack, connection, timeout):
+        command_log.append(command.strip())
+        return driver_3_0.SMOOTHIE_ACK
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_with_log)
+
+    smoothie.move_path([{'X': 418, 'Y': 353, 'A': 100},
+                        {'X': 10, 'Y': 20, 'A': 100},
+                        {'X': 10, 'Y': 20, 'A': 150}])
+    # All segments go out in one command with a single trailing M400, and
+    # segments that would not move are skipped
+    expected = [
+        ['M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4P0.005 '
+         'G0A100 G0X10Y20 G0A150 M400']
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
+    assert smoothie.position['X'] == 10
+    assert smoothie.position['Y'] == 20
+    assert smoothie.position['A'] == 150
+
+    with pytest.raises(ValueError):
+        smoothie.move_path([{'X': 1}, {'B': 2}])
+
+
 def test_set_active_current(smoothie, monkeypatch):
     from opentrons.drivers import serial_communication
     from opentrons.drivers.smoothie_drivers import driver_3_0
@@ -161,6 +161,26 @@ async def test_dispense(dummy_instruments, loop):
         == plunger_pos_2
 
 
+async def test_attached_instruments_snapshot(dummy_instruments, loop):
+    hw_api = hc.API.build_hardware_simulator(
+        attached_instruments=dummy_instruments, loop=loop)
+    await hw_api.home()
+    await hw_api.cache_instruments()
+    mount = types.Mount.LEFT
+    first = hw_api.attached_instruments
+    assert hw_api.attached_instruments is first
+    assert first[mount]['current_volume'] == 0
+
+    await hw_api.aspirate(mount, 5.0)
+    assert hw_api.attached_instruments[mount]['current_volume'] == 5.0
+    hw_api.set_flow_rate(mount, aspirate=2)
+    assert hw_api.attached_instruments[mount]['aspirate_flow_rate'] == 2
+    hw_api.add_tip(mount, 20)
+    assert hw_api.attached_instruments[mount]['has_tip']
+    hw_api.remove_tip(mount)
+    assert not hw_api.attached_instruments[mount]['has_tip']
+
+
 async def test_no_pipette(dummy_instruments, loop):
     hw_api = hc.API.build_hardware_simulator(
         attached_instruments=dummy_instruments, loop=loop)
@@ -195,3 +215,76 @@ async def test_pick_up_tip(dummy_instruments, loop):
     assert hw_api._attached_instruments[mount].has_tip
     assert hw_api._attached_instruments[mount].current_volume == 0
     assert hw_api._current_position == target_position
+
+
+async def test_drop_tip_shakes_in_one_path(dummy_instruments, loop,
+                                           monkeypatch):
+    hw_api = hc.API.build_hardware_simulator(
+        attached_instruments=dummy_instruments, loop=loop)
+    mount = types.Mount.LEFT
+    await hw_api.home()
+    await hw_api.cache_instruments()
+    await hw_api.move_to(mount, types.Point(100, 100, 100))
+    await hw_api.pick_up_tip(mount, 25.0)
+    await hw_api.move_to(mount, types.Point(100, 100, 100))
+    start = dict(hw_api._current_position)
+    paths = []
+    orig_move_path = hw_api._backend.move_path
+
+    def recording_move_path(targets, *args, **kwargs):
+        paths.append(targets)
+        return orig_move_path(targets, *args, **kwargs)
+
+    monkeypatch.setattr(hw_api._backend, 'move_path', recording_move_path)
+    await hw_api.drop_tip(mount, home_after=False)
+    assert len(paths) == 1
+    assert [target['X'] for target in paths[0]] == [
+        start[Axis.X] - 2.25, start[Axis.X] + 2.25, start[Axis.X]]
+    assert not hw_api._attached_instruments[mount].has_tip
+    assert hw_api._current_position[Axis.X] == start[Axis.X]
+    assert hw_api._current_position[Axis.Z] == start[Axis.Z] + 20
+
+
+async def test_set_flow_rate_and_plunger(dummy_instruments, loop):
+    hw_api = hc.API.build_hardware_simulator(
+        attached_instruments=dummy_instruments, loop=loop)
+    mount = types.Mount.LEFT
+    await hw_api.cache_instruments()
+    hw_api.set_flow_rate(mount, aspirate=1, dispense=2)
+    assert hw_api.attached_instruments[mount]['aspirate_flow_rate'] == 1
+    assert hw_api.attached_instruments[mount]['dispense_flow_rate'] == 2
+    pip = hw_api._attached_instruments[mount]
+    old_positions = pip.config.plunger_positions
+    before = dict(old_positions)
+    hw_api.calibrate_plunger(mount, top=3)
+    assert pip.config.plunger_positions == {**before, 'top': 3}
+    assert old_positions == before
+    hw_api.calibrate_plunger(mount, bottom=4)
+    assert pip.config.plunger_positions == {**before, 'top': 3, 'bottom': 4}
+    config = pip.config
+    hw_api.calibrate_plunger(mount)
+    assert pip.config is config
+
+
+async def test_plunger_move_to_current_position_skipped(
+        dummy_instruments, loop, monkeypatch):
+    hw_api = hc.API.build_hardware_simulator(
+        attached_instruments=dummy_instruments, loop=loop)
+    mount = types.Mount.LEFT
+    await hw_api.home()
+    await hw_api.cache_instruments()
+    bottom = hw_api._attached_instruments[mount].config.plunger_positions[
+        'bottom']
+    await hw_api._move_plunger(mount, bottom)
+    moves = []
+    orig_move = hw_api._backend.move
+
+    def recording_move(*args, **kwargs):
+        moves.append(args)
+        return orig_move(*args, **kwargs)
+
+    monkeypatch.setattr(hw_api._backend, 'move', recording_move)
+    await hw_api._move_plunger(mount, bottom)
+    assert not moves
+    await hw_api._move_plunger(mount, bottom - 1)
+    assert len(moves) == 1
@@ -63,6 +63,22 @@ async def test_home_specific_sim(hardware_api, monkeypatch):
                                               Axis.C: 19}
 
 
+async def test_home_single_backend_call(hardware_api, monkeypatch):
+    calls = []
+    orig_home = hardware_api._backend.home
+
+    def counting_home(axes=None):
+        calls.append(axes)
+        return orig_home(axes)
+
+    monkeypatch.setattr(hardware_api._backend, 'home', counting_home)
+    await hardware_api.home()
+    assert calls == [['X', 'Y', 'Z', 'A', 'B', 'C']]
+    calls.clear()
+    await hardware_api.home([Axis.A, Axis.C])
+    assert calls == [['A', 'C']]
+
+
 async def test_retract(hardware_api):
     await hardware_api.home()
     await hardware_api.move_to(types.Mount.RIGHT, types.Point(0, 10, 20))
@@ -103,6 +119,28 @@ async def test_move(hardware_api):
     assert hardware_api._current_position == target_position2
 
 
+async def test_move_path(hardware_api, monkeypatch):
+    await hardware_api.home()
+    moves = []
+
+    def mock_move_path(positions, speed=None, home_flagged_axes=True):
+        moves.append(positions)
+
+    monkeypatch.setattr(hardware_api._backend, 'move_path', mock_move_path)
+    mount = types.Mount.RIGHT
+    await hardware_api.move_path(mount, [types.Point(30, 20, 150),
+                                         types.Point(30, 20, 10)])
+    # The whole path goes to the backend in a single call
+    assert moves == [[{'X': 30, 'Y': 20, 'A': 150},
+                      {'X': 30, 'Y': 20, 'A': 10}]]
+    assert hardware_api._current_position == {Axis.X: 30,
+                                              Axis.Y: 20,
+                                              Axis.Z: 218,
+                                              Axis.A: 10,
+                                              Axis.B: 19,
+                                              Axis.C: 19}
+
+
 async def test_mount_offset_applied(hardware_api):
     await hardware_api.home()
     abs_position = types.Point(30, 20, 10)
@@ -210,6 +248,51 @@ async def test_deck_cal_applied(monkeypatch, loop):
     assert called_with['Z'] == 30
 
 
+async def test_gantry_transforms_follow_config(loop):
+    hardware_api = hc.API.build_hardware_simulator(loop=loop)
+    fwd, inv = hardware_api._gantry_transforms()
+    assert hardware_api._gantry_transforms()[0] is fwd
+    hardware_api.update_config(gantry_calibration=[[1, 0, 0, 10],
+                                                   [0, 1, 0, 20],
+                                                   [0, 0, 1, 30],
+                                                   [0, 0, 0, 1]])
+    new_fwd, new_inv = hardware_api._gantry_transforms()
+    assert new_fwd is not fwd
+    assert list(new_inv[:3, 3]) == [-10, -20, -30]
+
+
+async def test_gantry_position_cached(hardware_api):
+    await hardware_api.home()
+    hardware_api._backend._attached_instruments\
+        = {types.Mount.LEFT: {'model': None, 'id': None},
+           types.Mount.RIGHT: {'model': 'p10_single_v1', 'id': 'testyness'}}
+    await hardware_api.cache_instruments()
+    mount = types.Mount.RIGHT
+    await hardware_api.move_to(mount, types.Point(0, 0, 0))
+    first = await hardware_api.gantry_position(mount)
+    assert first == types.Point(0, 0, 0)
+    assert await hardware_api.gantry_position(mount) is first
+    assert await hardware_api.gantry_position(
+        mount, critical_point=CriticalPoint.MOUNT) == types.Point(0, 0, 13)
+
+    hardware_api.add_tip(mount, 33)
+    assert await hardware_api.gantry_position(mount) == types.Point(0, 0, -33)
+    await hardware_api.move_rel(mount, types.Point(0, 0, 10))
+    assert await hardware_api.gantry_position(mount) == types.Point(0, 0, -23)
+
+
+async def test_mount_offsets_follow_config(loop):
+    hardware_api = hc.API.build_hardware_simulator(loop=loop)
+    left = hardware_api._mount_offset(types.Mount.LEFT)
+    assert left == types.Point(*hardware_api.config.mount_offset)
+    assert hardware_api._mount_offset(types.Mount.LEFT) is left
+    assert hardware_api._mount_offset(types.Mount.RIGHT)\
+        == types.Point(0, 0, 0)
+    hardware_api.update_config(mount_offset=(-30, 0, 0))
+    assert hardware_api._mount_offset(types.Mount.LEFT)\
+        == types.Point(-30, 0, 0)
+
+
 async def test_other_mount_retracted(hardware_api):
     await hardware_api.home()
     await hardware_api.move_to(types.Mount.RIGHT, types.Point(0, 0, 0))
@@ -220,6 +303,35 @@ async def test_other_mount_retracted(hardware_api):
         == types.Point(54, 20, 218)
 
 
+async def test_no_retract_after_retract(hardware_api, monkeypatch):
+    await hardware_api.home()
+    await hardware_api.move_to(types.Mount.RIGHT, types.Point(0, 0, 0))
+    await hardware_api.retract(types.Mount.RIGHT, 10)
+    retracts = []
+    orig_fast_home = hardware_api._backend.fast_home
+
+    def counting_fast_home(axis, margin):
+        retracts.append(axis)
+        return orig_fast_home(axis, margin)
+
+    monkeypatch.setattr(hardware_api._backend, 'fast_home', counting_fast_home)
+    await hardware_api.move_to(types.Mount.LEFT, types.Point(20, 20, 0))
+    assert retracts == []
+    await hardware_api.move_to(types.Mount.RIGHT, types.Point(0, 0, 0))
+    assert retracts == ['Z']
+
+
+async def test_out_of_bounds_move_warns(hardware_api, caplog):
+    await hardware_api.home()
+    bounds = hardware_api._axis_bounds()
+    assert bounds[Axis.X] == hardware_api._backend.axis_bounds['X']
+    await hardware_api.home()
+    assert hardware_api._bounds_by_axis is None
+    await hardware_api.move_rel(types.Mount.RIGHT, types.Point(10, 0, 0))
+    assert any('Out of bounds move: X=' in record.getMessage()
+               for record in caplog.records)
+
+
 async def catch_oob_moves(hardware_api):
     await hardware_api.home()
     # Check axis max checking for move and move rel
@@ -274,3 +386,14 @@ async def catch_oob_moves(hardware_api):
         await hardware_api.move_rel(types.Mount.LEFT, types.Point(0, 0, 12))
     await hardware_api.pick_up_tip(types.Mount.LEFT)
     await hardware_api.move_rel(types.Mount.LEFT, types.Point(0, 0, 0))
+
+
+async def test_identify_blinks(hardware_api, monkeypatch):
+    calls = []
+
+    def fake_set_lights(button, rails):
+        calls.append(button)
+
+    monkeypatch.setattr(hardware_api._backend, 'set_lights', fake_set_lights)
+    await hardware_api.identify(1)
+    assert calls == [False, True, False, True, True]
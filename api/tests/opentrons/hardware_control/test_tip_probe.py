@@ -68,19 +68,20 @@ async def test_moves_to_hotspot(hardware_api, monkeypatch,
     center = await hardware_api.locate_tip_probe_center(mount, 30)
     hotspots = robot_configs.calculate_tip_probe_hotspots(
         30, hardware_api._config.tip_probe)
-    assert len(move_calls) == len(hotspots) * 4
+    # Only the first hotspot lifts to the safe height before crossing over
+    assert len(move_calls) == len(hotspots) * 3 + 1
     assert len(rel_calls) == len(hotspots)
     move_iter = iter(move_calls)
     rel_iter = iter(rel_calls)
     probe_iter = iter(probe_calls)
     bounce_base = hardware_api._config.tip_probe.bounce_distance
     old_center = hardware_api._config.tip_probe.center
+    next(move_iter)
     for hs in hotspots:
         x0 = old_center[0] + hs.x_start_offs
         y0 = old_center[1] + hs.y_start_offs
         z0 = hs.z_start_abs
         next(move_iter)
-        next(move_iter)
         rel = next(rel_iter)
         if hs.probe_distance < 0:
             bounce = bounce_base
@@ -13,6 +13,8 @@ def test_add_instrument(loop, monkeypatch):
         requested_instr = instr_name
         requested_mount = mount
 
+    # The globals are built on first access, which needs an event loop
+    back_compat.reset_globals(loop=loop)
     monkeypatch.setattr(back_compat.instruments._ctx,
                         'load_instrument', fake_load)
 
@@ -67,3 +69,12 @@ def test_labware_mappings(loop, monkeypatch):
     with pytest.raises(NotImplementedError,
                        match='Module load not yet implemented'):
         bc.load('magdeck', 3)
+
+
+def test_robot_forwards_to_context(loop):
+    ctx = ProtocolContext(loop)
+    rob = back_compat.BCRobot(None, ctx)
+    assert rob.home == ctx.home
+    assert 'home' in rob.__dict__
+    assert rob.deck is ctx.deck
+    assert 'deck' not in rob.__dict__
@@ -0,0 +1,8 @@
+from opentrons.types import Point
+
+
+def test_point_scaling():
+    assert Point(1, 2, 3) * 2 == Point(2, 4, 6)
+    assert 2 * Point(1, 2, 3) == Point(2, 4, 6)
+    assert 0.5 * Point(1, 2, 3) == Point(0.5, 1, 1.5)
+    assert isinstance(2 * Point(1, 2, 3), Point)